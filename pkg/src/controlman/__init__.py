@@ -58,6 +58,7 @@ def from_json_file(
     repo_path: str | _Path,
     filepath: str = const.FILEPATH_METADATA,
     validate: bool = True,
+    strict: bool = False,
 ) -> _ps.NestedDict:
     """Load control center data from the full JSON file.
 
@@ -69,6 +70,8 @@ def from_json_file(
         Relative path to the JSON file in the repository.
     validate
         Validate the data against the schema.
+    strict
+        Validate the data even if identical data has already been validated.
 
     Raises
     ------
@@ -80,7 +83,7 @@ def from_json_file(
     except _ps.exception.read.PySerialsReadException as e:
         raise _exception.load.ControlManInvalidMetadataError(cause=e, filepath=filepath) from None
     if validate:
-        _data_validator.validate(data=data, fill_defaults=False)
+        _data_validator.validate_metadata(data=data, strict=strict)
     return _ps.NestedDict(data)
 
 
@@ -88,6 +91,7 @@ def from_json_file_at_commit(
     git_manager: _Git,
     commit_hash: str,
     filepath: str = const.FILEPATH_METADATA,
+    strict: bool = False,
 ) -> _ps.NestedDict:
     data_str = git_manager.file_at_hash(
         commit_hash=commit_hash,
@@ -99,11 +103,11 @@ def from_json_file_at_commit(
         raise _exception.load.ControlManInvalidMetadataError(
             cause=e, filepath=filepath, commit_hash=commit_hash
         ) from None
-    _data_validator.validate(data=data, fill_defaults=False)
+    _data_validator.validate_metadata(data=data, strict=strict)
     return _ps.NestedDict(data)
 
 
-def from_json_string(data: str) -> _ps.NestedDict:
+def from_json_string(data: str, strict: bool = False) -> _ps.NestedDict:
     """Load control center data from the full JSON string.
 
     Parameters
@@ -112,6 +116,8 @@ def from_json_string(data: str) -> _ps.NestedDict:
         JSON data string.
     validate : bool, default: True
         Validate the data against the schema.
+    strict : bool, default: False
+        Validate the data even if identical data has already been validated.
 
     Raises
     ------
@@ -122,7 +128,7 @@ def from_json_string(data: str) -> _ps.NestedDict:
         data = _ps.read.json_from_string(data=data)
     except _ps.exception.read.PySerialsReadException as e:
         raise _exception.load.ControlManInvalidMetadataError(e) from None
-    _data_validator.validate(data=data, fill_defaults=False)
+    _data_validator.validate_metadata(data=data, strict=strict)
     return _ps.NestedDict(data)
 
 
@@ -0,0 +1,513 @@
+"""Compile JSON schemas into specialized Python validation functions.
+
+The generated functions only report whether an instance is valid.
+They mirror `jsonschema.Draft202012Validator` keyword by keyword,
+including the order in which keywords and subschemas are evaluated
+and where evaluation stops early, so that default values
+are filled exactly as during regular validation.
+Subschemas using keywords without a specialized implementation
+are delegated to the regular validator.
+"""
+
+from __future__ import annotations as _annotations
+
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+import copy as _copy
+import marshal as _marshal
+import numbers as _numbers
+import re as _re
+from urllib.parse import urljoin as _urljoin
+
+import jsonschema as _jsonschema
+from jsonschema import _utils as _jsonschema_utils
+import referencing as _referencing
+from referencing import jsonschema as _referencing_jsonschema
+from referencing.exceptions import Unresolvable as _Unresolvable
+
+if _TYPE_CHECKING:
+    from typing import Any, Callable
+    from types import CodeType
+
+
+class CompiledSchema:
+    """Validation function compiled from a JSON schema.
+
+    Parameters
+    ----------
+    code
+        Compiled module code defining the validation functions.
+    constants
+        Constant values referenced by the generated code.
+    fallbacks
+        Subschemas and their base URIs, which are validated by the regular validator.
+    schema
+        The root schema.
+    registry
+        Registry to resolve references in fallback subschemas.
+    validator_class
+        Regular validator class used for fallback subschemas.
+    """
+
+    def __init__(
+        self,
+        code: CodeType,
+        constants: list,
+        fallbacks: list[tuple[dict | bool, str]],
+        schema: dict | bool,
+        registry: _referencing.Registry,
+        validator_class: type[_jsonschema.protocols.Validator],
+    ):
+        self._code = code
+        self._constants = constants
+        self._fallbacks = fallbacks
+        registry = _registry_with_root(schema=schema, registry=registry)
+        namespace = _RUNTIME | {
+            "_c": constants,
+            "_fallback": [
+                _make_fallback(
+                    schema=fallback_schema,
+                    base_uri=base_uri,
+                    registry=registry,
+                    validator_class=validator_class,
+                ) for fallback_schema, base_uri in fallbacks
+            ],
+        }
+        exec(code, namespace)
+        self._func: Callable[[Any, bool], bool] = namespace[_ROOT_FUNC_NAME]
+        return
+
+    @classmethod
+    def from_schema(
+        cls,
+        schema: dict | bool,
+        registry: _referencing.Registry,
+        validator_class: type[_jsonschema.protocols.Validator],
+        fill_defaults: bool,
+    ) -> CompiledSchema:
+        """Compile a schema.
+
+        Parameters
+        ----------
+        schema
+            The schema to compile.
+        registry
+            Registry to resolve references.
+        validator_class
+            Regular validator class used for subschemas that cannot be compiled.
+            It must fill default values if and only if `fill_defaults` is set.
+        fill_defaults
+            Fill missing properties with their default values, like the regular validator.
+        """
+        compiler = _Compiler(registry=_registry_with_root(schema=schema, registry=registry), fill_defaults=fill_defaults)
+        source = compiler.compile(schema)
+        code = compile(source, "<controlman-compiled-schema>", "exec")
+        return cls(
+            code=code,
+            constants=compiler.constants,
+            fallbacks=compiler.fallbacks,
+            schema=schema,
+            registry=registry,
+            validator_class=validator_class,
+        )
+
+    @classmethod
+    def from_data(
+        cls,
+        data: dict,
+        schema: dict | bool,
+        registry: _referencing.Registry,
+        validator_class: type[_jsonschema.protocols.Validator],
+    ) -> CompiledSchema:
+        """Recreate a compiled schema from its serializable `data`."""
+        return cls(
+            code=_marshal.loads(data["code"]),
+            constants=data["constants"],
+            fallbacks=data["fallbacks"],
+            schema=schema,
+            registry=registry,
+            validator_class=validator_class,
+        )
+
+    @property
+    def data(self) -> dict:
+        """Picklable data of the compiled schema.
+
+        The data is only valid for the Python version it was created with.
+        """
+        return {
+            "code": _marshal.dumps(self._code),
+            "constants": self._constants,
+            "fallbacks": self._fallbacks,
+        }
+
+    def is_valid(self, instance: Any) -> bool:
+        """Check whether an instance is valid, filling default values if enabled."""
+        return self._func(instance, False)
+
+
+class _Compiler:
+
+    def __init__(self, registry: _referencing.Registry, fill_defaults: bool):
+        self._registry = registry
+        self._fill_defaults = fill_defaults
+        self._names: dict[tuple[int, str], str] = {}
+        self._pending: list[tuple[str, dict, str]] = []
+        self._sources: list[str] = []
+        self._constant_index: dict[int, int] = {}
+        self.constants: list = []
+        self.fallbacks: list[tuple[dict | bool, str]] = []
+        return
+
+    def compile(self, schema: dict | bool) -> str:
+        base_uri = schema.get("$id", "") if isinstance(schema, dict) else ""
+        root = self._function(schema, base_uri)
+        while self._pending:
+            self._write_function(*self._pending.pop())
+        self._sources.append(f"{_ROOT_FUNC_NAME} = {root}")
+        return "\n".join(self._sources)
+
+    def _function(self, schema: dict | bool, base_uri: str) -> str:
+        """Get the name of the function validating `schema`, queueing it for generation if new."""
+        if schema is True:
+            return "_valid"
+        if schema is False:
+            return "_invalid"
+        key = (id(schema), base_uri)
+        name = self._names.get(key)
+        if name is None:
+            name = self._names[key] = f"_f{len(self._names)}"
+            self._pending.append((name, schema, base_uri))
+        return name
+
+    def _descend(self, schema: dict | bool, base_uri: str) -> str:
+        """Get the name of the function validating a subschema entered via `descend`."""
+        if isinstance(schema, dict) and isinstance(schema.get("$id"), str):
+            base_uri = _urljoin(base_uri, schema["$id"])
+        return self._function(schema, base_uri)
+
+    def _constant(self, value: Any) -> str:
+        index = self._constant_index.get(id(value))
+        if index is None or self.constants[index] is not value:
+            index = self._constant_index[id(value)] = len(self.constants)
+            self.constants.append(value)
+        return f"_c[{index}]"
+
+    def _write_function(self, name: str, schema: dict, base_uri: str) -> None:
+        if not isinstance(schema, dict):
+            # Invalid schema; let the regular validator raise the appropriate error.
+            self._write_fallback(name, schema, base_uri)
+            return
+        lines = []
+        for keyword, value in schema.items():
+            if keyword not in _KEYWORDS:
+                continue
+            writer = getattr(self, f"_keyword_{keyword.removeprefix('$')}", None)
+            keyword_lines = writer(value, schema, base_uri) if writer else None
+            if keyword_lines is None:
+                self._write_fallback(name, schema, base_uri)
+                return
+            lines.extend(keyword_lines)
+        self._sources.extend(
+            [f"def {name}(instance, first):", "    ok = True", *[f"    {line}" for line in lines], "    return ok"]
+        )
+        return
+
+    def _write_fallback(self, name: str, schema: dict | bool, base_uri: str) -> None:
+        self._sources.append(f"{name} = _fallback[{len(self.fallbacks)}]")
+        self.fallbacks.append((schema, base_uri))
+        return
+
+    @staticmethod
+    def _fail(condition: str, indent: str = "") -> list[str]:
+        return [
+            f"{indent}if {condition}:",
+            f"{indent}    if first:",
+            f"{indent}        return False",
+            f"{indent}    ok = False",
+        ]
+
+    def _keyword_ref(self, value, schema, base_uri):
+        try:
+            resolved = self._registry.resolver(base_uri=base_uri).lookup(value)
+        except _Unresolvable:
+            return
+        func = self._function(resolved.contents, resolved.resolver._base_uri)
+        return self._fail(f"not {func}(instance, first)")
+
+    def _keyword_type(self, value, schema, base_uri):
+        types = value if isinstance(value, list) else [value]
+        if not all(isinstance(typ, str) and typ in _TYPE_CHECKS for typ in types):
+            return
+        checks = " or ".join(f"({_TYPE_CHECKS[typ]})" for typ in types) or "False"
+        return self._fail(f"not ({checks})")
+
+    def _keyword_enum(self, value, schema, base_uri):
+        if isinstance(value, list) and all(isinstance(each, str) for each in value):
+            return self._fail(f"not (isinstance(instance, str) and instance in {self._constant(frozenset(value))})")
+        return self._fail(f"all(not _equal(_each, instance) for _each in {self._constant(value)})")
+
+    def _keyword_const(self, value, schema, base_uri):
+        return self._fail(f"not _equal(instance, {self._constant(value)})")
+
+    def _keyword_format(self, value, schema, base_uri):
+        # Validators are created without a format checker, so formats are annotations only.
+        return []
+
+    def _keyword_pattern(self, value, schema, base_uri):
+        return self._fail(f"isinstance(instance, str) and not {self._constant(_re.compile(value))}.search(instance)")
+
+    def _keyword_minLength(self, value, schema, base_uri):
+        return self._fail(f"isinstance(instance, str) and len(instance) < {self._constant(value)}")
+
+    def _keyword_maxLength(self, value, schema, base_uri):
+        return self._fail(f"isinstance(instance, str) and len(instance) > {self._constant(value)}")
+
+    def _keyword_minimum(self, value, schema, base_uri):
+        return self._fail(f"({_TYPE_CHECKS['number']}) and instance < {self._constant(value)}")
+
+    def _keyword_maximum(self, value, schema, base_uri):
+        return self._fail(f"({_TYPE_CHECKS['number']}) and instance > {self._constant(value)}")
+
+    def _keyword_exclusiveMinimum(self, value, schema, base_uri):
+        return self._fail(f"({_TYPE_CHECKS['number']}) and instance <= {self._constant(value)}")
+
+    def _keyword_exclusiveMaximum(self, value, schema, base_uri):
+        return self._fail(f"({_TYPE_CHECKS['number']}) and instance >= {self._constant(value)}")
+
+    def _keyword_minItems(self, value, schema, base_uri):
+        return self._fail(f"isinstance(instance, list) and len(instance) < {self._constant(value)}")
+
+    def _keyword_maxItems(self, value, schema, base_uri):
+        return self._fail(f"isinstance(instance, list) and len(instance) > {self._constant(value)}")
+
+    def _keyword_uniqueItems(self, value, schema, base_uri):
+        if not value:
+            return []
+        return self._fail("isinstance(instance, list) and not _uniq(instance)")
+
+    def _keyword_minProperties(self, value, schema, base_uri):
+        return self._fail(f"isinstance(instance, dict) and len(instance) < {self._constant(value)}")
+
+    def _keyword_maxProperties(self, value, schema, base_uri):
+        return self._fail(f"isinstance(instance, dict) and len(instance) > {self._constant(value)}")
+
+    def _keyword_required(self, value, schema, base_uri):
+        return self._fail(
+            f"isinstance(instance, dict) and not all(_each in instance for _each in {self._constant(value)})"
+        )
+
+    def _keyword_dependentRequired(self, value, schema, base_uri):
+        return self._fail(
+            "isinstance(instance, dict) and not all("
+            f"_each in instance for _prop, _deps in {self._constant(value)}.items() "
+            "if _prop in instance for _each in _deps)"
+        )
+
+    def _keyword_properties(self, value, schema, base_uri):
+        lines = ["if isinstance(instance, dict):"]
+        defaults = [
+            (prop, subschema["default"]) for prop, subschema in value.items()
+            if isinstance(subschema, dict) and "default" in subschema
+        ] if self._fill_defaults else []
+        if defaults:
+            lines.extend(
+                [
+                    f"    for _prop, _default in {self._constant(defaults)}:",
+                    "        if _prop not in instance:",
+                    "            instance[_prop] = _deepcopy(_default)",
+                ]
+            )
+        for prop, subschema in value.items():
+            prop_const = self._constant(prop)
+            lines.append(f"    if {prop_const} in instance:")
+            lines.extend(
+                self._fail(f"not {self._descend(subschema, base_uri)}(instance[{prop_const}], first)", indent="        ")
+            )
+        if len(lines) == 1:
+            lines.append("    pass")
+        return lines
+
+    def _keyword_patternProperties(self, value, schema, base_uri):
+        lines = ["if isinstance(instance, dict):"]
+        for pattern, subschema in value.items():
+            lines.extend(
+                [
+                    "    for _key, _value in instance.items():",
+                    f"        if {self._constant(_re.compile(pattern))}.search(_key):",
+                    *self._fail(f"not {self._descend(subschema, base_uri)}(_value, first)", indent="            "),
+                ]
+            )
+        if len(lines) == 1:
+            lines.append("    pass")
+        return lines
+
+    def _keyword_additionalProperties(self, value, schema, base_uri):
+        if value is True or (isinstance(value, dict) and not value):
+            return []
+        known = {
+            "properties": dict.fromkeys(schema.get("properties", {})),
+            "patternProperties": dict.fromkeys(schema.get("patternProperties", {})),
+        }
+        lines = [
+            "if isinstance(instance, dict):",
+            f"    _extras = set(_find_additional_properties(instance, {self._constant(known)}))",
+        ]
+        if isinstance(value, dict):
+            lines.extend(
+                [
+                    "    for _key in _extras:",
+                    *self._fail(f"not {self._descend(value, base_uri)}(instance[_key], first)", indent="        "),
+                ]
+            )
+        else:
+            lines.extend(self._fail("_extras", indent="    "))
+        return lines
+
+    def _keyword_propertyNames(self, value, schema, base_uri):
+        return [
+            "if isinstance(instance, dict):",
+            "    for _key in instance:",
+            *self._fail(f"not {self._descend(value, base_uri)}(_key, first)", indent="        "),
+        ]
+
+    def _keyword_dependentSchemas(self, value, schema, base_uri):
+        lines = ["if isinstance(instance, dict):"]
+        for prop, subschema in value.items():
+            lines.append(f"    if {self._constant(prop)} in instance:")
+            lines.extend(self._fail(f"not {self._descend(subschema, base_uri)}(instance, first)", indent="        "))
+        if len(lines) == 1:
+            lines.append("    pass")
+        return lines
+
+    def _keyword_prefixItems(self, value, schema, base_uri):
+        lines = ["if isinstance(instance, list):"]
+        for index, subschema in enumerate(value):
+            lines.append(f"    if len(instance) > {index}:")
+            lines.extend(self._fail(f"not {self._descend(subschema, base_uri)}(instance[{index}], first)", indent="        "))
+        if len(lines) == 1:
+            lines.append("    pass")
+        return lines
+
+    def _keyword_items(self, value, schema, base_uri):
+        prefix = len(schema.get("prefixItems", []))
+        if value is False:
+            return self._fail(f"isinstance(instance, list) and len(instance) > {prefix}")
+        return [
+            "if isinstance(instance, list):",
+            f"    for _item in instance[{prefix}:]:",
+            *self._fail(f"not {self._descend(value, base_uri)}(_item, first)", indent="        "),
+        ]
+
+    def _keyword_contains(self, value, schema, base_uri):
+        return self._fail(
+            f"isinstance(instance, list) and not _contains(instance, {self._function(value, base_uri)}, "
+            f"{self._constant(schema.get('minContains', 1))}, {self._constant(schema.get('maxContains'))})"
+        )
+
+    def _keyword_allOf(self, value, schema, base_uri):
+        lines = []
+        for subschema in value:
+            lines.extend(self._fail(f"not {self._descend(subschema, base_uri)}(instance, first)"))
+        return lines
+
+    def _keyword_anyOf(self, value, schema, base_uri):
+        # Branches are evaluated completely until the first valid one, like `list(descend(...))`.
+        calls = " or ".join(f"{self._descend(subschema, base_uri)}(instance, False)" for subschema in value)
+        return self._fail(f"not ({calls or 'False'})")
+
+    def _keyword_oneOf(self, value, schema, base_uri):
+        funcs = ", ".join(self._descend(subschema, base_uri) for subschema in value)
+        return self._fail(f"not _one_of(instance, ({funcs}{',' if funcs else ''}))")
+
+    def _keyword_not(self, value, schema, base_uri):
+        return self._fail(f"{self._function(value, base_uri)}(instance, True)")
+
+    def _keyword_if(self, value, schema, base_uri):
+        lines = [f"if {self._function(value, base_uri)}(instance, True):"]
+        if "then" in schema:
+            lines.extend(self._fail(f"not {self._descend(schema['then'], base_uri)}(instance, first)", indent="    "))
+        else:
+            lines.append("    pass")
+        if "else" in schema:
+            lines.append("else:")
+            lines.extend(self._fail(f"not {self._descend(schema['else'], base_uri)}(instance, first)", indent="    "))
+        return lines
+
+
+def _registry_with_root(schema: dict | bool, registry: _referencing.Registry) -> _referencing.Registry:
+    """Add the root schema to the registry, like `jsonschema` does for the schema of a validator."""
+    resource = _referencing_jsonschema.DRAFT202012.create_resource(schema)
+    return registry.with_resource(uri=resource.id() or "", resource=resource)
+
+
+def _make_fallback(
+    schema: dict | bool,
+    base_uri: str,
+    registry: _referencing.Registry,
+    validator_class: type[_jsonschema.protocols.Validator],
+) -> Callable[[Any, bool], bool]:
+    validator = validator_class(schema, registry=registry, _resolver=registry.resolver(base_uri=base_uri))
+
+    def fallback(instance, first: bool) -> bool:
+        if first:
+            return validator.is_valid(instance)
+        return not list(validator.iter_errors(instance))
+
+    return fallback
+
+
+def _valid(instance, first: bool) -> bool:
+    return True
+
+
+def _invalid(instance, first: bool) -> bool:
+    return False
+
+
+def _one_of(instance, funcs: tuple[Callable[[Any, bool], bool], ...]) -> bool:
+    for index, func in enumerate(funcs):
+        if func(instance, False):
+            break
+    else:
+        return False
+    more_valid = [func for func in funcs[index + 1:] if func(instance, True)]
+    return not more_valid
+
+
+def _contains(instance: list, func: Callable[[Any, bool], bool], min_contains: int, max_contains: int | None) -> bool:
+    if max_contains is None:
+        max_contains = len(instance)
+    matches = 0
+    for each in instance:
+        if func(each, True):
+            matches += 1
+            if matches > max_contains:
+                return False
+    return matches >= min_contains
+
+
+_ROOT_FUNC_NAME = "_root"
+_KEYWORDS = frozenset(_jsonschema.Draft202012Validator.VALIDATORS)
+_TYPE_CHECKS = {
+    "array": "isinstance(instance, list)",
+    "boolean": "isinstance(instance, bool)",
+    "integer": (
+        "isinstance(instance, int) and not isinstance(instance, bool) "
+        "or isinstance(instance, float) and instance.is_integer()"
+    ),
+    "null": "instance is None",
+    "number": "isinstance(instance, _Number) and not isinstance(instance, bool)",
+    "object": "isinstance(instance, dict)",
+    "string": "isinstance(instance, str)",
+}
+_RUNTIME = {
+    "_Number": _numbers.Number,
+    "_deepcopy": _copy.deepcopy,
+    "_equal": _jsonschema_utils.equal,
+    "_uniq": _jsonschema_utils.uniq,
+    "_find_additional_properties": _jsonschema_utils.find_additional_properties,
+    "_valid": _valid,
+    "_invalid": _invalid,
+    "_one_of": _one_of,
+    "_contains": _contains,
+}
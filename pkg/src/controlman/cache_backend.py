@@ -0,0 +1,374 @@
+"""Storage backends for the control center cache.
+
+Each backend stores cached items by category (`typ`) and key,
+where each item is a dictionary with the keys
+`timestamp`, `data`, and optionally `accessed`, `expires`, `etag` and `last_modified`
+(see the `cache` schema).
+"""
+
+from __future__ import annotations as _annotations
+
+from typing import TYPE_CHECKING as _TYPE_CHECKING, Iterator as _Iterator
+import abc as _abc
+import json as _json
+import os as _os
+import sqlite3 as _sqlite3
+import stat as _stat
+import tempfile as _tempfile
+
+from loggerman import logger as _logger
+import pyserials as _ps
+import mdit as _mdit
+
+from controlman import exception as _exception
+from controlman import data_validator as _data_validator
+
+if _TYPE_CHECKING:
+    from pathlib import Path
+
+
+class CacheBackend(_abc.ABC):
+    """Base class for control center cache storage backends."""
+
+    def __init__(self, path: Path | None = None):
+        self._path = path
+        return
+
+    @property
+    def path(self) -> Path | None:
+        """Path to the cache file, or `None` if the cache is only kept in memory."""
+        return self._path
+
+    @_abc.abstractmethod
+    def get(self, typ: str, key: str) -> dict | None:
+        """Get a cached item, or `None` if it does not exist."""
+        ...
+
+    @_abc.abstractmethod
+    def set(self, typ: str, key: str, item: dict) -> None:
+        """Add or replace a cached item."""
+        ...
+
+    def set_many(self, typ: str, items: dict[str, dict]) -> None:
+        """Add or replace multiple cached items of the same category."""
+        for key, item in items.items():
+            self.set(typ, key, item)
+        return
+
+    @_abc.abstractmethod
+    def delete(self, typ: str, key: str) -> None:
+        """Remove a cached item."""
+        ...
+
+    @_abc.abstractmethod
+    def touch(self, typ: str, key: str, accessed: str) -> None:
+        """Update the access time of an existing item."""
+        ...
+
+    def touch_many(self, accessed: dict[tuple[str, str], str]) -> None:
+        """Update the access times of multiple existing items, given by category and key."""
+        for (typ, key), timestamp in accessed.items():
+            self.touch(typ, key, timestamp)
+        return
+
+    @_abc.abstractmethod
+    def entries(self) -> _Iterator[tuple[str, str, dict]]:
+        """Iterate over the category, key, and metadata of all items.
+
+        The metadata is the item without its `data`.
+        """
+        ...
+
+    @_abc.abstractmethod
+    def save(self) -> None:
+        """Persist all changes to the cache file."""
+        ...
+
+    def close(self) -> None:
+        """Release the cache file; unsaved changes are discarded.
+
+        The backend cannot be used afterwards.
+        """
+        return
+
+    def _log_new_cache(self, reason: str | None = None, traceback: bool = False):
+        msg = _mdit.inline_container(
+            "The provided filepath ",
+            _mdit.element.code_span(str(self._path)),
+            f" for control center cache {reason}. ",
+            "Initialized a new cache.",
+        ) if reason else "No filepath provided for control center cache. Initialized a new cache."
+        log_content = [msg]
+        if traceback:
+            log_content.append(_logger.traceback())
+        _logger.warning("Cache Initialization", *log_content, stack_up=1)
+        return
+
+    def _log_loaded_cache(self):
+        _logger.success(
+            "Cache Initialization",
+            _mdit.inline_container(
+                "Loaded control center cache from ",
+                _mdit.element.code_span(str(self._path)),
+            )
+        )
+        return
+
+
+class YAMLCacheBackend(CacheBackend):
+    """Cache stored as a single YAML file, which is fully loaded and rewritten on save."""
+
+    def __init__(self, path: Path | None = None):
+        super().__init__(path=path)
+        self._cache = {}
+        if not path:
+            self._log_new_cache()
+        elif not path.is_file():
+            self._log_new_cache("does not exist")
+        else:
+            try:
+                self._cache = _ps.read.yaml_from_file(path=path)
+            except _ps.exception.read.PySerialsReadException as e:
+                self._log_new_cache("is corrupted", traceback=True)
+            try:
+                _data_validator.validate(
+                    data=self._cache,
+                    schema="cache",
+                )
+            except _exception.ControlManException:
+                self._log_new_cache("is invalid", traceback=True)
+            else:
+                self._log_loaded_cache()
+        return
+
+    def get(self, typ: str, key: str) -> dict | None:
+        return self._cache.get(typ, {}).get(key)
+
+    def set(self, typ: str, key: str, item: dict) -> None:
+        self._cache.setdefault(typ, {})[key] = item
+        return
+
+    def delete(self, typ: str, key: str) -> None:
+        category = self._cache.get(typ, {})
+        category.pop(key, None)
+        if not category:
+            self._cache.pop(typ, None)
+        return
+
+    def touch(self, typ: str, key: str, accessed: str) -> None:
+        item = self.get(typ, key)
+        if item:
+            item["accessed"] = accessed
+        return
+
+    def entries(self) -> _Iterator[tuple[str, str, dict]]:
+        for typ, category in list(self._cache.items()):
+            for key, item in list(category.items()):
+                yield typ, key, {k: v for k, v in item.items() if k != "data"}
+
+    def save(self) -> None:
+        # Write to a temporary file first and replace the cache file in one step,
+        # so that concurrent runs never read a truncated cache.
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = _tempfile.mkstemp(dir=self._path.parent, prefix=f"{self._path.name}.", suffix=".tmp")
+        try:
+            with _os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+                temp_file.write(_ps.write.to_yaml_string(data=self._cache))
+            # `mkstemp` creates the file with mode 0600; keep the permissions of the
+            # existing cache file, or use the default permissions for a new file.
+            if self._path.is_file():
+                mode = _stat.S_IMODE(self._path.stat().st_mode)
+            else:
+                umask = _os.umask(0)
+                _os.umask(umask)
+                mode = 0o666 & ~umask
+            _os.chmod(temp_path, mode)
+            _os.replace(temp_path, self._path)
+        except BaseException:
+            _os.unlink(temp_path)
+            raise
+        return
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Cache stored in an SQLite database with one row per item.
+
+    Items are read on demand and written as individual upserts,
+    so neither loading nor saving the cache depends on its total size.
+    The data of each item is stored as JSON, so that reading a shared cache
+    written by other processes never executes code (as unpickling could).
+
+    Parameters
+    ----------
+    path
+        Path to the database file.
+    shared
+        Whether the database is shared between concurrent processes.
+        In this case, the database is used in write-ahead logging mode
+        and each change is committed immediately,
+        so that no process holds the write lock for longer than a single statement.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS cache ("
+        "typ TEXT NOT NULL, "
+        "key TEXT NOT NULL, "
+        "timestamp TEXT NOT NULL, "
+        "accessed TEXT, "
+        "expires TEXT, "
+        "etag TEXT, "
+        "last_modified TEXT, "
+        "data TEXT NOT NULL, "
+        "PRIMARY KEY (typ, key))"
+    )
+
+    _UPSERT = (
+        "INSERT OR REPLACE INTO cache (typ, key, timestamp, accessed, expires, etag, last_modified, data) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+
+    def __init__(self, path: Path | None = None, shared: bool = False):
+        super().__init__(path=path)
+        self._shared = shared
+        if not path:
+            self._log_new_cache()
+            self._connection = _sqlite3.connect(":memory:")
+        else:
+            exists = path.is_file()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                self._connection = self._connect(path, shared=shared)
+            except _sqlite3.DatabaseError:
+                self._log_new_cache("is corrupted", traceback=True)
+                path.unlink()
+                self._connection = self._connect(path, shared=shared)
+            else:
+                if exists:
+                    self._log_loaded_cache()
+                else:
+                    self._log_new_cache("does not exist")
+        self._connection.execute(self._SCHEMA)
+        return
+
+    def get(self, typ: str, key: str) -> dict | None:
+        row = self._connection.execute(
+            "SELECT timestamp, accessed, expires, etag, last_modified, data FROM cache WHERE typ = ? AND key = ?",
+            (typ, key),
+        ).fetchone()
+        if not row:
+            return
+        timestamp, accessed, expires, etag, last_modified, data = row
+        try:
+            item = {"timestamp": timestamp, "data": _json.loads(data)}
+        except ValueError:
+            # Unreadable items (e.g., pickled by a previous version) are treated as missing.
+            return
+        if accessed:
+            item["accessed"] = accessed
+        if expires:
+            item["expires"] = expires
+        if etag:
+            item["etag"] = etag
+        if last_modified:
+            item["last_modified"] = last_modified
+        return item
+
+    def set(self, typ: str, key: str, item: dict) -> None:
+        self._connection.execute(self._UPSERT, self._row(typ, key, item))
+        return
+
+    def set_many(self, typ: str, items: dict[str, dict]) -> None:
+        rows = [self._row(typ, key, item) for key, item in items.items()]
+        if not self._shared:
+            self._connection.executemany(self._UPSERT, rows)
+            return
+        # Write all items in a single transaction, instead of one per statement.
+        with self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.executemany(self._UPSERT, rows)
+        return
+
+    def delete(self, typ: str, key: str) -> None:
+        self._connection.execute("DELETE FROM cache WHERE typ = ? AND key = ?", (typ, key))
+        return
+
+    def touch(self, typ: str, key: str, accessed: str) -> None:
+        self._connection.execute(
+            "UPDATE cache SET accessed = ? WHERE typ = ? AND key = ?", (accessed, typ, key)
+        )
+        return
+
+    def touch_many(self, accessed: dict[tuple[str, str], str]) -> None:
+        rows = [(timestamp, typ, key) for (typ, key), timestamp in accessed.items()]
+        if not self._shared:
+            self._connection.executemany("UPDATE cache SET accessed = ? WHERE typ = ? AND key = ?", rows)
+            # Commit right away, so that the write lock is not held until the cache is saved.
+            self._connection.commit()
+            return
+        with self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.executemany("UPDATE cache SET accessed = ? WHERE typ = ? AND key = ?", rows)
+        return
+
+    def entries(self) -> _Iterator[tuple[str, str, dict]]:
+        rows = self._connection.execute(
+            "SELECT typ, key, timestamp, accessed, expires, etag, last_modified FROM cache"
+        ).fetchall()
+        for typ, key, timestamp, accessed, expires, etag, last_modified in rows:
+            metadata = {"timestamp": timestamp}
+            for name, value in (
+                ("accessed", accessed), ("expires", expires), ("etag", etag), ("last_modified", last_modified)
+            ):
+                if value:
+                    metadata[name] = value
+            yield typ, key, metadata
+
+    def save(self) -> None:
+        self._connection.commit()
+        return
+
+    def close(self) -> None:
+        self._connection.close()
+        return
+
+    @staticmethod
+    def _row(typ: str, key: str, item: dict) -> tuple:
+        return (
+            typ,
+            key,
+            item["timestamp"],
+            item.get("accessed"),
+            item.get("expires"),
+            item.get("etag"),
+            item.get("last_modified"),
+            _json.dumps(item["data"]),
+        )
+
+    @classmethod
+    def _connect(cls, path: Path, shared: bool = False) -> _sqlite3.Connection:
+        if shared:
+            # Autocommit mode; wait for other processes' writes instead of failing.
+            connection = _sqlite3.connect(path, timeout=60, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+        else:
+            connection = _sqlite3.connect(path)
+        # Fails for files that are not SQLite databases.
+        connection.execute(cls._SCHEMA)
+        columns = {row[1] for row in connection.execute("PRAGMA table_info(cache)")}
+        for column in ("accessed", "expires"):
+            if column in columns:
+                continue
+            try:
+                connection.execute(f"ALTER TABLE cache ADD COLUMN {column} TEXT")
+            except _sqlite3.OperationalError:
+                # Already added by a concurrent process.
+                pass
+            connection.commit()
+        return connection
+
+
+BACKENDS: dict[str, type[CacheBackend]] = {
+    "yaml": YAMLCacheBackend,
+    "sqlite": SQLiteCacheBackend,
+}
+"""Available cache backends by name."""
@@ -1,4 +1,5 @@
 from pathlib import Path as _Path
+from typing import Literal as _Literal, Iterable as _Iterable
 import datetime as _datetime
 
 
@@ -6,8 +7,8 @@ from loggerman import logger as _logger
 import pyserials as _ps
 import mdit as _mdit
 
-from controlman import exception as _exception, const as _const
-from controlman import data_validator as _data_validator
+from controlman import const as _const
+from controlman import cache_backend as _cache_backend
 from controlman import date
 
 class CacheManager:
@@ -16,55 +17,40 @@ class CacheManager:
         self,
         path_local_cache: _Path | str | None = None,
         retention_hours: dict[str, float] | None = None,
+        max_items: dict[str, int] | None = None,
+        backend: _Literal["yaml", "sqlite"] = "yaml",
+        log_data: bool = False,
+        path_shared_cache: _Path | str | None = None,
+        private_types: _Iterable[str] = ("repo",),
+        shared_max_items: dict[str, int] | None = None,
     ):
-
-        def log_msg_new_cache(reason: str | None = None, traceback: bool = False):
-            msg = _mdit.inline_container(
-                "The provided filepath ",
-                _mdit.element.code_span(str(self._path)),
-                f" for control center cache {reason}. ",
-                "Initialized a new cache.",
-            ) if reason else "No filepath provided for control center cache. Initialized a new cache."
-            log_content = [msg]
-            if traceback:
-                log_content.append(_logger.traceback())
-            _logger.warning(log_title, *log_content, stack_up=1)
-            return
-
-        log_title = "Cache Initialization"
-
-        self._cache = {}
         self._retention_hours = retention_hours or {}
-
+        self._max_items = max_items or {}
+        self._shared_max_items = shared_max_items or {}
+        self._log_data = log_data
+        backend_class = _cache_backend.BACKENDS[backend]
+        path = None
         if path_local_cache:
-            self._path = _Path(path_local_cache).resolve() / _const.DIRNAME_LOCAL_REPODYNAMICS / _const.FILENAME_METADATA_CACHE
-            if not self._path.is_file():
-                log_msg_new_cache("does not exist")
-            else:
-                try:
-                    self._cache = _ps.read.yaml_from_file(path=self._path)
-                except _ps.exception.read.PySerialsReadException as e:
-                    log_msg_new_cache("is corrupted", traceback=True)
-                try:
-                    _data_validator.validate(
-                        data=self._cache,
-                        schema="cache",
-                    )
-                except _exception.ControlManException:
-                    log_msg_new_cache("is invalid", traceback=True)
-                else:
-                    _logger.success(
-                        log_title,
-                        _mdit.inline_container(
-                            "Loaded control center cache from ",
-                            _mdit.element.code_span(str(self._path)),
-                        )
-                    )
-        else:
-            self._path = None
-            log_msg_new_cache()
+            filename = _const.FILENAME_METADATA_CACHE_SQLITE if backend == "sqlite" else _const.FILENAME_METADATA_CACHE
+            path = _Path(path_local_cache).resolve() / _const.DIRNAME_LOCAL_REPODYNAMICS / filename
+        self._backend: _cache_backend.CacheBackend = backend_class(path=path)
+        self._path = path
+        self._shared_backend: _cache_backend.SQLiteCacheBackend | None = None
+        if path_shared_cache:
+            self._shared_backend = _cache_backend.SQLiteCacheBackend(
+                path=_Path(path_shared_cache).expanduser().resolve() / _const.FILENAME_SHARED_METADATA_CACHE,
+                shared=True,
+            )
+        self._private_types = set(private_types)
+        self._dirty: set[tuple[str, str]] = set()
+        self._accessed: dict[tuple[str, str], str] = {}
         return
 
+    @property
+    def dir_path(self) -> _Path | None:
+        """Directory of the control center cache file, if a local cache is used."""
+        return self._path.parent if self._path else None
+
     def get(self, typ: str, key: str):
         log_title = _mdit.inline_container(
             "Cache Retrieval for ", _mdit.element.code_span(f"{typ}.{key}")
@@ -79,7 +65,7 @@ class CacheManager:
                 )
             )
             return
-        item = self._cache.get(typ, {}).get(key)
+        item = self._backend_for(typ).get(typ, key)
         if not item:
             _logger.info(log_title, "Item not found.")
             return
@@ -90,53 +76,255 @@ class CacheManager:
                 f"Item expired.\n- Timestamp: {timestamp}\n- Retention Hours: {self._retention_hours}"
             )
             return
+        # Access times are only used for eviction; they are written in one batch on save,
+        # instead of one write per retrieval.
+        self._accessed[(typ, key)] = date.to_iso(date.from_now())
         _logger.info(
             log_title,
-            "Item found.",
-            _mdit.element.code_block(_ps.write.to_yaml_string(item["data"]), language="yaml")
+            f"Item found ({self._summarize(item['data'], timestamp)}).",
+            *self._data_log_block(item["data"]),
         )
         return item["data"]
 
-    def set(self, typ: str, key: str, value: dict | list | str | int | float | bool):
+    def get_stale(self, typ: str, key: str) -> tuple[dict | list | str | int | float | bool, str | None, str | None] | None:
+        """Get an item regardless of its expiry, for revalidation with a conditional HTTP request.
+
+        Returns
+        -------
+        tuple | None
+            The cached data, ETag and Last-Modified header of the item,
+            or `None` if the item does not exist or has neither header.
+        """
+        item = self._backend_for(typ).get(typ, key)
+        if not item or not (item.get("etag") or item.get("last_modified")):
+            return
+        return item["data"], item.get("etag"), item.get("last_modified")
+
+    def renew(self, typ: str, key: str) -> None:
+        """Reset the timestamp of an existing item, e.g., after it has been successfully revalidated."""
+        item = self._backend_for(typ).get(typ, key)
+        if not item:
+            return
+        item["timestamp"] = date.to_iso(date.from_now())
+        item.pop("expires", None)
+        item |= self._expiry(typ, item["timestamp"])
+        self._backend_for(typ).set(typ, key, item)
+        self._dirty.add((typ, key))
+        _logger.info(
+            _mdit.inline_container(
+                "Cache Renewal for ",
+                _mdit.element.code_span(f"{typ}.{key}")
+            ),
+            f"Item is unchanged; timestamp renewed to {item['timestamp']}.",
+        )
+        return
+
+    def set(
+        self,
+        typ: str,
+        key: str,
+        value: dict | list | str | int | float | bool,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ):
+        timestamp = date.to_iso(date.from_now())
         new_item = {
-            "timestamp": date.to_iso(date.from_now()),
+            "timestamp": timestamp,
             "data": value,
-        }
-        self._cache.setdefault(typ, {})[key] = new_item
+        } | self._expiry(typ, timestamp)
+        if etag:
+            new_item["etag"] = etag
+        if last_modified:
+            new_item["last_modified"] = last_modified
+        self._backend_for(typ).set(typ, key, new_item)
+        self._dirty.add((typ, key))
         _logger.info(
             _mdit.inline_container(
             "Cache Set for ",
                 _mdit.element.code_span(f"{typ}.{key}")
             ),
-            _mdit.element.code_block(_ps.write.to_yaml_string(value), language="yaml")
+            f"Item set ({self._summarize(value)}).",
+            *self._data_log_block(value),
+        )
+        return
+
+    def set_many(self, typ: str, values: dict[str, dict | list | str | int | float | bool]):
+        """Add or replace multiple items of the same type in one batch."""
+        if not values:
+            return
+        timestamp = date.to_iso(date.from_now())
+        expiry = self._expiry(typ, timestamp)
+        self._backend_for(typ).set_many(
+            typ, {key: {"timestamp": timestamp, "data": value} | expiry for key, value in values.items()}
+        )
+        self._dirty.update((typ, key) for key in values)
+        _logger.info(
+            _mdit.inline_container(
+                "Cache Set for ",
+                _mdit.element.code_span(typ)
+            ),
+            f"{len(values)} items set.",
+            *self._data_log_block(values),
         )
         return
 
     def save(self):
+        """Save all changes and close the cache.
+
+        The cache manager cannot be used afterwards.
+        """
         log_title = "Cache Save"
-        if self._path:
-            _ps.write.to_yaml_file(
-                data=self._cache,
-                path=self._path,
-                make_dirs=True,
-            )
-            _logger.success(
-                log_title,
-                _mdit.inline_container(
-                    "Saved control center cache to ",
-                    _mdit.element.code_span(str(self._path)),
-                )
-            )
+        self._flush_access_times()
+        self._compact()
+        if not self._dirty:
+            _logger.info(log_title, "No cached items were changed. Skipped saving cache.")
         else:
-            _logger.warning(
-                log_title,
-                "No filepath provided for control center cache. Skipped saving cache."
-            )
+            saved_paths = []
+            if self._shared_backend:
+                self._shared_backend.save()
+                saved_paths.append(self._shared_backend.path)
+            if self._path:
+                self._backend.save()
+                saved_paths.append(self._path)
+            if saved_paths:
+                self._dirty.clear()
+                for path in saved_paths:
+                    _logger.success(
+                        log_title,
+                        _mdit.inline_container(
+                            "Saved control center cache to ",
+                            _mdit.element.code_span(str(path)),
+                        )
+                    )
+            else:
+                _logger.warning(
+                    log_title,
+                    "No filepath provided for control center cache. Skipped saving cache."
+                )
+        # Release the cache files, so that they can be written by other cache managers.
+        self._backend.close()
+        if self._shared_backend:
+            self._shared_backend.close()
         return
 
+    def _flush_access_times(self) -> None:
+        """Write the buffered access times of retrieved items to the backends.
+
+        Access times in the shared cache are only written for types
+        with a maximum number of items in the shared cache configuration,
+        since they are not used otherwise.
+        Retrieved items are marked as changed, so that their access times
+        are saved even when no item was added or removed.
+        """
+        accessed_private = {}
+        accessed_shared = {}
+        for (typ, key), timestamp in self._accessed.items():
+            if self._backend_for(typ) is self._backend:
+                accessed_private[(typ, key)] = timestamp
+            elif self._shared_max_items.get(typ):
+                accessed_shared[(typ, key)] = timestamp
+        if accessed_private:
+            self._backend.touch_many(accessed_private)
+        if accessed_shared:
+            self._shared_backend.touch_many(accessed_shared)
+        self._dirty.update(accessed_private)
+        self._dirty.update(accessed_shared)
+        self._accessed.clear()
+        return
+
+    def _compact(self) -> None:
+        """Remove expired items and evict the least recently used items of full categories.
+
+        Expired items with an ETag or Last-Modified header are kept,
+        since they can still be revalidated with a conditional request;
+        they are only removed when their category exceeds its maximum size.
+        Since the shared cache is used by other repositories as well,
+        its items are only removed according to their own expiry date,
+        and the maximum sizes of the shared cache configuration.
+        """
+        removed: list[tuple[str, str]] = []
+        for backend, max_items, shared in (
+            (self._backend, self._max_items, False),
+            (self._shared_backend, self._shared_max_items, True),
+        ):
+            if not backend:
+                continue
+            categories: dict[str, list[tuple[str, str]]] = {}
+            for typ, key, metadata in backend.entries():
+                if not shared and backend is not self._backend_for(typ):
+                    # Left over from a previous scoping configuration.
+                    continue
+                if shared:
+                    expired = "expires" in metadata and date.from_iso(metadata["expires"]) <= date.from_now()
+                else:
+                    expired = typ in self._retention_hours and self._is_expired(typ, metadata["timestamp"])
+                if expired and not (metadata.get("etag") or metadata.get("last_modified")):
+                    removed.append((typ, key))
+                    backend.delete(typ, key)
+                    continue
+                categories.setdefault(typ, []).append((metadata.get("accessed") or metadata["timestamp"], key))
+            for typ, items in categories.items():
+                max_items_typ = max_items.get(typ)
+                if not max_items_typ or len(items) <= max_items_typ:
+                    continue
+                items.sort(key=lambda item: date.from_iso(item[0]), reverse=True)
+                for _, key in items[max_items_typ:]:
+                    removed.append((typ, key))
+                    backend.delete(typ, key)
+        if not removed:
+            return
+        self._dirty.update(removed)
+        _logger.info(
+            "Cache Compaction",
+            f"Removed {len(removed)} expired or least recently used items.",
+        )
+        return
+
+    def _backend_for(self, typ: str) -> _cache_backend.CacheBackend:
+        """Backend storing the given cache type.
+
+        All types except private ones are stored in the shared cache, if available.
+        """
+        if self._shared_backend and typ not in self._private_types:
+            return self._shared_backend
+        return self._backend
+
+    def _expiry(self, typ: str, timestamp: str) -> dict[str, str]:
+        """Expiry date of a new item, as a partial cache item.
+
+        This is stored with each item so that the shared cache can be compacted
+        according to the retention hours of the repository that cached the item.
+        """
+        retention_hours = self._retention_hours.get(typ)
+        if not retention_hours or retention_hours == float("inf"):
+            return {}
+        return {"expires": date.to_iso(date.from_iso(timestamp) + _datetime.timedelta(hours=retention_hours))}
+
     def _is_expired(self, typ: str, timestamp: str) -> bool:
-        time_delta = _datetime.timedelta(hours=self._retention_hours[typ])
-        if not time_delta:
+        retention_hours = self._retention_hours[typ]
+        if not retention_hours or retention_hours == float("inf"):
             return False
+        time_delta = _datetime.timedelta(hours=retention_hours)
         exp_date = date.from_iso(timestamp) + time_delta
         return exp_date <= _datetime.datetime.now(tz=_datetime.UTC)
+
+    def _data_log_block(self, data) -> list:
+        """Full cached data for the log, only rendered when data logging is enabled.
+
+        Serializing large items (e.g., GitHub user data or license texts)
+        takes a significant share of the runtime, so by default only a summary is logged.
+        """
+        if not self._log_data:
+            return []
+        return [_mdit.element.code_block(_ps.write.to_yaml_string(data), language="yaml")]
+
+    @staticmethod
+    def _summarize(data, timestamp: str | None = None) -> str:
+        if isinstance(data, dict | list | tuple | str):
+            summary = f"{type(data).__name__} of size {len(data)}"
+        else:
+            summary = type(data).__name__
+        if timestamp:
+            age = _datetime.datetime.now(tz=_datetime.UTC) - date.from_iso(timestamp)
+            summary += f", cached {age.total_seconds() / 3600:.1f} hours ago"
+        return summary
@@ -28,6 +28,7 @@ from controlman import data_validator as _data_validator
 from controlman.reporter import ControlCenterReporter as _ControlCenterReporter
 from controlman.changelog_manager import ChangelogManager
 from controlman import data_helper as _helper
+from controlman import web_api as _web_api
 
 
 class CenterManager:
@@ -46,13 +47,18 @@ class CenterManager:
         self._data_before: _ps.NestedDict = data_before
         self._data_main: _ps.NestedDict = data_main
         self._github_token = github_token
-        self._github_api = _pylinks.api.github(token=github_token)
+        self._github_api = _web_api.GitHub(token=github_token)
         self._future_vers = future_versions or {}
 
         self._path_root = self._git.repo_path
         relpath_local_cache = self._data_before.get("local.cache.path")
         path_local_cache = None
         retention_hours = self._data_before.get("control.cache.retention_hours", {})
+        max_items = self._data_before.get("control.cache.max_items", {})
+        cache_backend = self._data_before.get("control.cache.backend", "yaml")
+        cache_log_data = False
+        cache_shared = self._data_before.get("control.cache.shared", {})
+        self._processes = self._data_before.get("control.processes", 1)
         if relpath_local_cache:
             path_local_cache = self._path_root / relpath_local_cache
             path_local_config = path_local_cache / const.FILENAME_LOCAL_CONFIG
@@ -64,9 +70,20 @@ class CenterManager:
                         raise _load_exception.ControlManInvalidConfigFileDataError(cause=e) from None
                     _data_validator.validate(data=local_config, schema="local")
                     retention_hours = local_config.get("retention_hours", {})
+                    max_items = local_config.get("max_items", max_items)
+                    cache_backend = local_config.get("backend", cache_backend)
+                    cache_log_data = local_config.get("log_data", False)
+                    cache_shared = local_config.get("shared", cache_shared)
+                    self._processes = local_config.get("processes", self._processes)
         self._cache_manager: CacheManager = CacheManager(
             path_local_cache=path_local_cache,
             retention_hours=retention_hours,
+            max_items=max_items,
+            backend=cache_backend,
+            log_data=cache_log_data,
+            path_shared_cache=cache_shared.get("path"),
+            private_types=cache_shared.get("private", ["repo"]),
+            shared_max_items=cache_shared.get("max_items"),
         )
         self._hook_manager = _HookManager(
             dir_path=self._path_cc / const.DIRNAME_CC_HOOK,
@@ -78,6 +95,12 @@ class CenterManager:
         )
         with _logger.sectioning("CCA Initialization Hooks"):
             self._hook_manager.generate(const.FUNCNAME_CC_HOOK_INIT)
+        self._validator_before = _data_validator.SubtreeValidator(
+            source="source",
+            before_substitution=True,
+            backend="compiled",
+            processes=self._processes,
+        )
         self._data_raw: _ps.NestedDict | None = None
         self._data: _ps.NestedDict | None = None
         self._files: list[_GeneratedFile] = []
@@ -93,11 +116,12 @@ class CenterManager:
             full_data = _data_loader.load(
                 path_cc=self._path_cc,
                 cache_manager=self._cache_manager,
+                processes=self._processes,
             )
         with _logger.sectioning("CCA Load Hooks"):
             self._hook_manager.generate(const.FUNCNAME_CC_HOOK_LOAD, data=full_data)
         with _logger.sectioning("Post-Load Data Validation"):
-            _data_validator.validate(data=full_data, source="source", before_substitution=True)
+            self._validator_before.validate(data=full_data)
         with _logger.sectioning("CCA Load Validation Hooks"):
             self._hook_manager.generate(const.FUNCNAME_CC_HOOK_LOAD_VALID, data=full_data)
         changelog_manager = ChangelogManager(repo_path=self._git.repo_path)
@@ -170,8 +194,13 @@ class CenterManager:
             # Example: A key may be referencing `team.owner.email.url`, which has a default
             # value based on `team.owner.email.id`. But since `team.owner` is generated
             # dynamically, the default value for `team.owner.email.url` is not set in the initial validation.
-            _data_validator.validate(data=data(), source="source", before_substitution=True)
-        _data_gen.validate_user_schema(data, before_substitution=True)
+            # Only top-level keys changed by data generation and hooks are revalidated.
+            self._validator_before.validate(data=data())
+        _data_gen.validate_user_schema(
+            data,
+            before_substitution=True,
+            cache_dir=self._cache_manager.dir_path,
+        )
         with _logger.sectioning("CCA Augmentation Validation Hooks"):
             self._hook_manager.generate(
                 const.FUNCNAME_CC_HOOK_AUGMENT_VALID,
@@ -193,7 +222,9 @@ class CenterManager:
             )
         data = _ps.NestedDict(_ps.update.remove_keys(data(), const.RELATIVE_TEMPLATE_KEYS))
         with _logger.sectioning("Final Data Validation"):
-            _data_validator.validate(data=data(), source="source")
+            _data_validator.validate(
+                data=data(), source="source", backend="compiled", processes=self._processes
+            )
         with _logger.sectioning("CCA Templating Validation Hooks"):
             self._hook_manager.generate(
                 const.FUNCNAME_CC_HOOK_TEMPLATE_VALID,
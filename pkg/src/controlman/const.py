@@ -15,7 +15,12 @@ FILEPATH_CHANGELOG = ".github/.repodynamics/changelog.json"
 FILEPATH_CONTRIBUTORS = ".github/.repodynamics/contributors.json"
 FILEPATH_VARIABLES = ".github/.repodynamics/variables.json"
 FILENAME_METADATA_CACHE = ".metadata_cache.yaml"
+FILENAME_METADATA_CACHE_SQLITE = ".metadata_cache.sqlite"
+FILENAME_SHARED_METADATA_CACHE = "metadata_cache.sqlite"
+FILENAME_PARSED_CONFIG_CACHE = ".parsed_config_cache.pickle"
 FILENAME_LOCAL_CONFIG = "config.yaml"
+FILENAME_SCHEMA_REGISTRY_SNAPSHOT = ".schema_registry_{variant}.pickle"
+DIRNAME_COMPILED_SCHEMAS = "compiled_schemas"
 
 DIRNAME_CC_HOOK = "hooks"
 
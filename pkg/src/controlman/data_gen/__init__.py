@@ -8,6 +8,7 @@ from controlman.data_gen.main import MainDataGenerator as _MainDataGenerator
 from controlman.data_gen.repo import RepoDataGenerator as _RepoDataGenerator
 
 if _TYPE_CHECKING:
+    from pathlib import Path
     from gittidy import Git
     from pylinks.api import GitHub
     from pyserials.nested_dict import NestedDict
@@ -53,7 +54,7 @@ def generate(
     return data
 
 
-def validate_user_schema(data: NestedDict, before_substitution: bool):
+def validate_user_schema(data: NestedDict, before_substitution: bool, cache_dir: Path | None = None):
 
     def validate_data(key: str, dynamic_data):
         if isinstance(dynamic_data, str) or "jsonschema" in dynamic_data:
@@ -67,6 +68,7 @@ def validate_user_schema(data: NestedDict, before_substitution: bool):
             schema=dynamic_data["jsonschema"]["schema"],
             before_substitution=before_substitution,
             fill_defaults=fill,
+            cache_dir=cache_dir,
         )
         if fill:
             dynamic_data.update(data_only)
@@ -11,6 +11,7 @@ import pyserials as _ps
 import controlman
 from controlman import data_helper as _helper
 from controlman import exception as _exception
+from controlman import request_scheduler as _request_scheduler
 from controlman import date
 
 if _TYPE_CHECKING:
@@ -58,11 +59,18 @@ class MainDataGenerator:
                 remotes=self._git.get_remotes(),
             )
         username, repo_name = repo_address
+        # The same repository object, and the scheduler's pooled connections,
+        # are used for all subsequent repository queries.
         self._gh_api_repo = self._gh_api.user(username).repo(repo_name)
-        repo_info = self._gh_api.user(username).repo(repo_name).info
+        cache_key = f"{username}/{repo_name}"
+        repo_info = self._cache.get("repo", cache_key)
+        if not repo_info:
+            repo_info = self._gh_api_repo.info
+            # The raw response is cached, so that it can be replayed offline.
+            self._cache.set("repo", cache_key, repo_info)
         log_info = _mdit.inline_container(
             "Retrieved data for repository ",
-            _mdit.element.code_span(f'{username}/{repo_name}'),
+            _mdit.element.code_span(cache_key),
             "."
         )
         if "source" in repo_info:
@@ -81,24 +89,24 @@ class MainDataGenerator:
             log_info,
             repo_info_code_block,
         )
-        repo_info["created_at"] = date.to_internal(date.from_github(repo_info["created_at"]))
         ccm_repo = self._data.setdefault("repo", {})
         ccm_repo["owner"] = repo_info["owner"]["login"]
         ccm_repo.update(
             {k: repo_info[k] for k in ("id", "node_id", "name", "full_name", "created_at", "default_branch")}
         )
+        # Converted in the output instead of the cached response.
+        ccm_repo["created_at"] = date.to_internal(date.from_github(ccm_repo["created_at"]))
         ccm_repo.setdefault("url", {})["home"] = repo_info["html_url"]
         self._data["team.owner.github"] = {"id": repo_info["owner"]["login"], "rest_id": repo_info["owner"]["id"]}
         return
 
     def _team(self) -> None:
         self._data.fill("team")
-        for person_id in self._data["team"].keys():
-            _helper.fill_entity(
-                entity=self._data[f"team.{person_id}"],
-                github_api=self._gh_api,
-                cache_manager=self._cache,
-            )
+        _helper.fill_entities(
+            entities=[self._data[f"team.{person_id}"] for person_id in self._data["team"].keys()],
+            github_api=self._gh_api,
+            cache_manager=self._cache,
+        )
         return
 
     def _license(self):
@@ -162,7 +170,7 @@ class MainDataGenerator:
                 if source_data:
                     licence = class_(source_data)
                 else:
-                    licence = func(spdx_id)
+                    licence = _request_scheduler.scheduler.call(_request_scheduler.HOST_GITHUB_RAW, func, spdx_id)
                     self._cache.set("license", spdx_id, licence.raw_data)
                 header_xml = (licence.header_xml_str or "") if spdx_typ == "license" else ""
                 out_data = {
@@ -203,16 +211,15 @@ class MainDataGenerator:
 
     def _discussion_categories(self):
         discussions_info = self._cache.get("repo", f"discussion_categories")
-        if discussions_info:
-            return
-        if not self._gh_api.authenticated:
-            _logger.notice(
-                "GitHub Discussion Categories",
-                "GitHub token not provided. Cannot get discussions categories."
-            )
-            return
-        discussions_info = self._gh_api_repo.discussion_categories()
-        self._cache.set("repo", f"discussions_categories", discussions_info)
+        if not discussions_info:
+            if not self._gh_api.authenticated:
+                _logger.notice(
+                    "GitHub Discussion Categories",
+                    "GitHub token not provided. Cannot get discussions categories."
+                )
+                return
+            discussions_info = self._gh_api_repo.discussion_categories()
+            self._cache.set("repo", f"discussion_categories", discussions_info)
         discussion = self._data.setdefault("discussion.category", {})
         for category in discussions_info:
             category_obj = discussion.setdefault(category["slug"], {})
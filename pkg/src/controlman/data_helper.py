@@ -3,19 +3,32 @@
 from __future__ import annotations as _annotations
 
 from typing import TYPE_CHECKING as _TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
 import re as _re
 
 from loggerman import logger as _logger
 import pylinks as _pl
+from pylinks.exception.api import WebAPIError as _WebAPIError
 import pyserials as _ps
 
 from controlman import data_validator as _validator
+from controlman import request_scheduler as _request_scheduler
+from controlman import web_api as _web_api
 
 if _TYPE_CHECKING:
     from typing import Sequence, Callable
     from controlman.cache_manager import CacheManager
 
 
+_GITHUB_GRAPHQL_BATCH_SIZE = 50
+"""Maximum number of users to retrieve in a single GraphQL query."""
+
+_GITHUB_GRAPHQL_USER_FIELDS = (
+    "__typename login databaseId id url name company bio avatarUrl websiteUrl location email "
+    "twitterUsername createdAt socialAccounts(first: 100) { nodes { provider url } }"
+)
+
+
 def team_members_with_role_types(
     get: Callable,
     role_types: str | Sequence[str],
@@ -142,96 +155,93 @@ def fill_entity(
     cache_manager: CacheManager | None = None,
 ) -> tuple[dict, dict | None]:
     """Fill all missing information in an `entity` object."""
+    return fill_entities(entities=[entity], github_api=github_api, cache_manager=cache_manager)[0]
 
-    def _get_github_user(username: str | None = None, user_id: str | None = None) -> dict:
 
-        def add_social(name, user, url):
-            socials[name] = {"id": user, "url": url}
-            return
+def fill_entities(
+    entities: Sequence[dict],
+    github_api: _pl.api.GitHub,
+    cache_manager: CacheManager | None = None,
+    max_workers: int = 8,
+) -> list[tuple[dict, dict | None]]:
+    """Fill all missing information in a batch of `entity` objects.
 
-        user_info = {}
-        if user_id and cache_manager:
-            user_info = cache_manager.get("user", user_id)
-        if user_info:
-            return user_info
-        user = github_api.user_from_id(user_id) if user_id else github_api.user(username)
-        user_info = user.info
-        if user_info["blog"] and "://" not in user_info["blog"]:
-            user_info["blog"] = f"https://{user_info['blog']}"
-        social_accounts_info = user.social_accounts
-        socials = {}
-        user_info["socials"] = socials
-        for account in social_accounts_info:
-            for provider, base_pattern, id_pattern in (
-                ("orcid", r'orcid.org/', r'([0-9]{4}-[0-9]{4}-[0-9]{4}-[0-9]{3}[0-9X]{1})(.*)'),
-                ("researchgate", r'researchgate.net/profile/', r'([a-zA-Z0-9_-]+)(.*)'),
-                ("linkedin", r'linkedin.com/in/', r'([a-zA-Z0-9_-]+)(.*)'),
-                ("twitter", r'twitter.com/', r'([a-zA-Z0-9_-]+)(.*)'),
-                ("twitter", r'x.com/', r'([a-zA-Z0-9_-]+)(.*)'),
-            ):
-                match = _re.search(rf"{base_pattern}{id_pattern}", account["url"])
-                if match:
-                    add_social(
-                        provider,
-                        match.group(1),
-                        f"https://{base_pattern}{match.group(1)}{match.group(2)}"
-                    )
-                    break
-            else:
-                if account["provider"] != "generic":
-                    add_social(account["provider"], None, account["url"])
-                else:
-                    generics = socials.setdefault("generics", [])
-                    generics.append(account["url"])
-                    _logger.info(f"Unknown account", account['url'])
-        if cache_manager:
-            cache_manager.set("user", user_info["id"], user_info)
-        return user_info
+    This is equivalent to calling `fill_entity` on each entity,
+    but uncached GitHub users and publications are retrieved concurrently,
+    all entities are validated in a single pass,
+    and their templates are filled by a single template filler.
 
-    def get_orcid_publications(orcid_id: str) -> list[dict]:
-        dois = []
-        if cache_manager:
-            dois = cache_manager.get("orcid", orcid_id)
-        if not dois:
-            dois = _pl.api.orcid(orcid_id=orcid_id).doi
-            if cache_manager:
-                cache_manager.set("orcid", orcid_id, dois)
-        publications = []
-        for doi in dois:
-            publication_data = {}
-            if cache_manager:
-                publication_data = cache_manager.get("doi", doi)
-            if not publication_data:
-                publication_data = _pl.api.doi(doi=doi).curated
-                if cache_manager:
-                    cache_manager.set("doi", doi, publication_data)
-            publications.append(publication_data)
-        return sorted(publications, key=lambda i: i["date_tuple"], reverse=True)
-
-    def make_name(user: dict):
-        username = user["login"]
-        if not user.get("name"):
-            _logger.warning(
-                f"GitHub user {username} has no name",
-                f"Setting entity to legal person",
-            )
-            return {"legal": username}
-        if user["type"] != "User":
-            return {"legal": user["name"]}
-        name_parts = user["name"].split(" ")
-        if len(name_parts) != 2:
-            _logger.warning(
-                f"GitHub user {user} has a non-standard name",
-                f"Setting entity to legal person with name '{user['name']}'.",
-            )
-            return {"legal": user["name"]}
-        return {"first": name_parts[0], "last": name_parts[1]}
-
-    gh_id = entity.get("github", {}).get("rest_id")
-    gh_username = entity.get("github", {}).get("id")
-    github_user_info = None
-    if gh_id or gh_username:
-        github_user_info = _get_github_user(username=gh_username, user_id=gh_id)
+    Parameters
+    ----------
+    max_workers
+        Maximum number of concurrent requests to each API.
+
+    Returns
+    -------
+    list[tuple[dict, dict | None]]
+        The filled entity and the GitHub user information (if any)
+        for each input entity, in the same order.
+    """
+    github_users = [
+        (entity.get("github", {}).get("id"), entity.get("github", {}).get("rest_id"))
+        for entity in entities
+    ]
+    github_user_info_of = dict(
+        zip(
+            (user for user in github_users if any(user)),
+            _get_github_users(
+                github_api=github_api,
+                users=[user for user in github_users if any(user)],
+                cache_manager=cache_manager,
+                max_workers=max_workers,
+            ),
+        )
+    )
+    github_user_infos = [
+        _complete_entity(
+            entity=entity,
+            github_user_info=github_user_info_of.get(github_user),
+        )
+        for entity, github_user in zip(entities, github_users)
+    ]
+    orcid_entities = [entity for entity in entities if "orcid" in entity and entity["orcid"].get("get_pubs")]
+    publications = _get_orcid_publications(
+        orcid_ids=[entity["orcid"]["user"] for entity in orcid_entities],
+        cache_manager=cache_manager,
+        max_workers=max_workers,
+    )
+    for entity in orcid_entities:
+        entity["orcid"]["pubs"] = publications[entity["orcid"]["user"]]
+    _validator.validate_many(
+        data=entities,
+        schema="entity",
+        before_substitution=True,
+        backend="compiled",
+    )
+    filler = _ps.update.TemplateFiller()
+    return [
+        (filler.fill(data=entity) if entity else entity, github_user_info)
+        for entity, github_user_info in zip(entities, github_user_infos)
+    ]
+
+
+def _complete_entity(
+    entity: dict,
+    github_user_info: dict | None = None,
+) -> dict | None:
+    """Add information from GitHub to an `entity` object in-place.
+
+    Parameters
+    ----------
+    github_user_info
+        The GitHub user information of the entity, if it has a GitHub account.
+
+    Returns
+    -------
+    dict | None
+        The GitHub user information of the entity, if it has a GitHub account.
+    """
+    if github_user_info:
         for key_self, key_gh in (
             ("id", "login"),
             ("rest_id", "id"),
@@ -240,7 +250,7 @@ def fill_entity(
         ):
             entity["github"][key_self] = github_user_info[key_gh]
         if "name" not in entity:
-            entity["name"] = make_name(github_user_info)
+            entity["name"] = _make_entity_name(github_user_info)
         for key_self, key_gh in (
             ("affiliation", "company"),
             ("bio", "bio"),
@@ -256,16 +266,263 @@ def fill_entity(
         for social_name, social_data in github_user_info["socials"].items():
             if social_name in ("orcid", "researchgate", "linkedin", "twitter") and social_name not in entity:
                 entity[social_name] = social_data
-    if "orcid" in entity and entity["orcid"].get("get_pubs"):
-        entity["orcid"]["pubs"] = get_orcid_publications(orcid_id=entity["orcid"]["user"])
-    _validator.validate(
-        data=entity,
-        schema = "entity",
-        before_substitution = True
+    return github_user_info
+
+
+def _get_github_users(
+    github_api: _pl.api.GitHub,
+    users: Sequence[tuple[str | None, str | None]],
+    cache_manager: CacheManager | None = None,
+    max_workers: int = 8,
+) -> list[dict]:
+    """Get information of GitHub users, fetching uncached users in batches.
+
+    When the GitHub API is authenticated,
+    the profiles and social accounts of uncached users with a known username
+    (but no REST ID, which is always used for lookup when available)
+    are retrieved in batches of aliased GraphQL queries.
+    Fields that are only available in the REST API are then filled from their REST user data,
+    so that the information has the same format regardless of how it was retrieved.
+    All other users (i.e., those with a REST ID, organizations,
+    and all users when unauthenticated) are fetched entirely from the REST API.
+    REST requests are sent concurrently.
+
+    Parameters
+    ----------
+    users
+        Username and REST ID (either can be `None`) of each user.
+    max_workers
+        Maximum number of concurrent REST requests.
+
+    Returns
+    -------
+    list[dict]
+        Information of each user, in the same order.
+    """
+    user_infos = {}
+    uncached = []
+    # The cache is only accessed from this thread.
+    for username, user_id in dict.fromkeys(users):
+        user_info = cache_manager.get("user", user_id) if user_id and cache_manager else None
+        if user_info:
+            user_infos[(username, user_id)] = user_info
+        else:
+            uncached.append((username, user_id))
+    queried = {}
+    if github_api.authenticated:
+        usernames = list(dict.fromkeys(username for username, user_id in uncached if username and not user_id))
+        for batch_start in range(0, len(usernames), _GITHUB_GRAPHQL_BATCH_SIZE):
+            batch = usernames[batch_start:batch_start + _GITHUB_GRAPHQL_BATCH_SIZE]
+            try:
+                queried |= _query_github_users(github_api=github_api, usernames=batch)
+            except _WebAPIError:
+                _logger.warning(
+                    "GitHub GraphQL Query",
+                    f"Failed to query {len(batch)} users; falling back to the REST API.",
+                    _logger.traceback(),
+                )
+    fetched = {}
+    if uncached:
+        with _ThreadPoolExecutor(max_workers=min(max_workers, len(uncached))) as executor:
+            fetched_user_infos = executor.map(
+                lambda user: _fetch_github_user(
+                    github_api=github_api,
+                    username=user[0],
+                    user_id=user[1],
+                    queried=None if user[1] else queried.get(user[0]),
+                ),
+                uncached,
+            )
+            fetched = dict(zip(uncached, fetched_user_infos))
+        _request_scheduler.scheduler.flush_log()
+    for user in uncached:
+        user_info = fetched[user]
+        user_infos[user] = user_info
+        # Logging is not thread-safe, so fetched data is only logged here, after all workers are done.
+        for url in user_info["socials"].get("generics", []):
+            _logger.info("Unknown account", url)
+        if cache_manager:
+            cache_manager.set("user", user_info["id"], user_info)
+    return [user_infos[user] for user in users]
+
+
+def _query_github_users(github_api: _pl.api.GitHub, usernames: Sequence[str]) -> dict[str, tuple[dict, list[dict]]]:
+    """Query GitHub users by username in a single GraphQL request.
+
+    Returns
+    -------
+    dict[str, tuple[dict, list[dict]]]
+        User information and social accounts by username,
+        for all users that were found (organizations are not found).
+        Both are in the same format as the REST API,
+        but user information only includes the fields available in the GraphQL API.
+    """
+    signature = ", ".join(f"$login{idx}: String!" for idx in range(len(usernames)))
+    body = " ".join(
+        f"user{idx}: user(login: $login{idx}) {{ {_GITHUB_GRAPHQL_USER_FIELDS} }}" for idx in range(len(usernames))
     )
-    entity_ = _ps.NestedDict(entity)
-    entity_.fill()
-    return entity_(), github_user_info
+    # Partial data (e.g., when some users are not found) is returned alongside errors.
+    response = github_api.rest_query(
+        "graphql",
+        verb="POST",
+        json={
+            "query": f"query({signature}) {{ {body} }}",
+            "variables": {f"login{idx}": username for idx, username in enumerate(usernames)},
+        },
+    )
+    data = (response or {}).get("data") or {}
+    users = {}
+    for idx, username in enumerate(usernames):
+        user = data.get(f"user{idx}")
+        if not user:
+            continue
+        user_info = {
+            "login": user["login"],
+            "id": user["databaseId"],
+            "node_id": user["id"],
+            "html_url": user["url"],
+            "type": user["__typename"],
+            "name": user["name"] or None,
+            "company": user["company"] or None,
+            "blog": user["websiteUrl"] or "",
+            "location": user["location"] or None,
+            "email": user["email"] or None,
+            "bio": user["bio"] or None,
+            "twitter_username": user["twitterUsername"],
+            "avatar_url": user["avatarUrl"],
+            "created_at": user["createdAt"],
+        }
+        social_accounts = [
+            {"provider": account["provider"].lower(), "url": account["url"]}
+            for account in user["socialAccounts"]["nodes"]
+        ]
+        users[username] = user_info, social_accounts
+    return users
+
+
+def _fetch_github_user(
+    github_api: _pl.api.GitHub,
+    username: str | None = None,
+    user_id: str | None = None,
+    queried: tuple[dict, list[dict]] | None = None,
+) -> dict:
+    """Fetch information of a GitHub user from the REST API.
+
+    Parameters
+    ----------
+    queried
+        User information and social accounts already retrieved from the GraphQL API
+        (see `_query_github_users`); only the remaining fields are then filled from the REST API.
+    """
+    if queried:
+        user_info, social_accounts = queried
+        return _process_github_user(
+            user_info=github_api.user(username).info | user_info,
+            social_accounts=social_accounts,
+        )
+    user = github_api.user_from_id(user_id) if user_id else github_api.user(username)
+    return _process_github_user(user_info=user.info, social_accounts=user.social_accounts)
+
 
+def _process_github_user(user_info: dict, social_accounts: list[dict]) -> dict:
 
+    def add_social(name, user, url):
+        socials[name] = {"id": user, "url": url}
+        return
 
+    if user_info["blog"] and "://" not in user_info["blog"]:
+        user_info["blog"] = f"https://{user_info['blog']}"
+    socials = {}
+    user_info["socials"] = socials
+    for account in social_accounts:
+        for provider, base_pattern, id_pattern in (
+            ("orcid", r'orcid.org/', r'([0-9]{4}-[0-9]{4}-[0-9]{4}-[0-9]{3}[0-9X]{1})(.*)'),
+            ("researchgate", r'researchgate.net/profile/', r'([a-zA-Z0-9_-]+)(.*)'),
+            ("linkedin", r'linkedin.com/in/', r'([a-zA-Z0-9_-]+)(.*)'),
+            ("twitter", r'twitter.com/', r'([a-zA-Z0-9_-]+)(.*)'),
+            ("twitter", r'x.com/', r'([a-zA-Z0-9_-]+)(.*)'),
+        ):
+            match = _re.search(rf"{base_pattern}{id_pattern}", account["url"])
+            if match:
+                add_social(
+                    provider,
+                    match.group(1),
+                    f"https://{base_pattern}{match.group(1)}{match.group(2)}"
+                )
+                break
+        else:
+            if account["provider"] != "generic":
+                add_social(account["provider"], None, account["url"])
+            else:
+                generics = socials.setdefault("generics", [])
+                generics.append(account["url"])
+    return user_info
+
+
+def _get_orcid_publications(
+    orcid_ids: Sequence[str],
+    cache_manager: CacheManager | None = None,
+    max_workers: int = 8,
+) -> dict[str, list[dict]]:
+    """Get the publications of ORCID users, fetching uncached data concurrently.
+
+    DOIs shared between users are only fetched once,
+    and all fetched data is added to the cache in one batch per type.
+
+    Returns
+    -------
+    dict[str, list[dict]]
+        Publications of each user, sorted from newest to oldest.
+    """
+
+    def get_all(typ: str, keys, fetch):
+        data = {}
+        uncached = []
+        # The cache is only accessed from this thread.
+        for key in dict.fromkeys(keys):
+            cached = cache_manager.get(typ, key) if cache_manager else None
+            if cached:
+                data[key] = cached
+            else:
+                uncached.append(key)
+        if not uncached:
+            return data
+        with _ThreadPoolExecutor(max_workers=min(max_workers, len(uncached))) as executor:
+            fetched = dict(zip(uncached, executor.map(fetch, uncached)))
+        _request_scheduler.scheduler.flush_log()
+        if cache_manager:
+            cache_manager.set_many(typ, fetched)
+        return data | fetched
+
+    dois = get_all("orcid", orcid_ids, lambda orcid_id: _web_api.Orcid(orcid_id=orcid_id).doi)
+    publications = get_all(
+        "doi",
+        (doi for orcid_id in orcid_ids for doi in dois[orcid_id]),
+        lambda doi: _web_api.DOI(doi=doi).curated,
+    )
+    return {
+        orcid_id: sorted(
+            (publications[doi] for doi in dois[orcid_id]), key=lambda i: i["date_tuple"], reverse=True
+        )
+        for orcid_id in orcid_ids
+    }
+
+
+def _make_entity_name(user: dict) -> dict:
+    username = user["login"]
+    if not user.get("name"):
+        _logger.warning(
+            f"GitHub user {username} has no name",
+            f"Setting entity to legal person",
+        )
+        return {"legal": username}
+    if user["type"] != "User":
+        return {"legal": user["name"]}
+    name_parts = user["name"].split(" ")
+    if len(name_parts) != 2:
+        _logger.warning(
+            f"GitHub user {user} has a non-standard name",
+            f"Setting entity to legal person with name '{user['name']}'.",
+        )
+        return {"legal": user["name"]}
+    return {"first": name_parts[0], "last": name_parts[1]}
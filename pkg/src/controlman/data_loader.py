@@ -1,22 +1,56 @@
+from __future__ import annotations as _annotations
+
+from typing import NamedTuple as _NamedTuple
 from pathlib import Path as _Path
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor, ThreadPoolExecutor as _ThreadPoolExecutor
+import copy as _copy
+import hashlib as _hashlib
+import importlib.metadata as _importlib_metadata
+import os as _os
+import pickle as _pickle
 
 import ruamel.yaml as _yaml
 
 import pyserials as _ps
-import pylinks as _pl
 from pylinks.exception.api import WebAPIError as _WebAPIError
 
 from controlman.exception import load as _exception
 from controlman.cache_manager import CacheManager as _CacheManager
 from controlman import const as _const
+from controlman import request_scheduler as _request_scheduler
 import mdit as _mdit
 from loggerman import logger as _logger
 
 
 def load(
     path_cc: _Path,
-    cache_manager: _CacheManager | None = None
+    cache_manager: _CacheManager | None = None,
+    processes: int | None = None,
+    fetch_workers: int = 8,
 ) -> dict:
+    """Load and merge all control center configuration files.
+
+    Parameters
+    ----------
+    path_cc
+        Path to the control center directory.
+    cache_manager
+        Cache manager for external data referenced by `!ext` tags.
+    processes
+        Number of worker processes to parse files concurrently.
+        Files are still merged sequentially in sorted order,
+        and files that fail to parse or contain `!ext` tags are parsed in this process,
+        so results and errors are the same as in sequential mode.
+    fetch_workers
+        Maximum number of concurrent requests when prefetching
+        the external data of `!ext` tags.
+
+    Notes
+    -----
+    When the cache manager uses a local cache directory,
+    parsed files are also cached there (see `ParsedFileCache`),
+    so that unchanged files are not parsed again in the next run.
+    """
 
     def _load_file(filepath: _Path):
         file_content = filepath.read_text().strip()
@@ -30,21 +64,32 @@ def load(
                 ),
             )
             return
-        try:
-            data = _ps.read.yaml_from_file(
-                path=filepath,
-                safe=True,
-                constructors={
-                    _const.CC_EXTENSION_TAG: _create_external_tag_constructor(
-                        tag_name=_const.CC_EXTENSION_TAG,
-                        cache_manager=cache_manager,
-                        filepath=filepath,
-                        file_content=file_content,
+        if filepath in cached_data:
+            data = cached_data[filepath]
+        else:
+            dependencies = {}
+            if filepath in parsed_data:
+                data = parsed_data[filepath]
+            else:
+                try:
+                    data = _ps.read.yaml_from_file(
+                        path=filepath,
+                        safe=True,
+                        constructors={
+                            _const.CC_EXTENSION_TAG: _create_external_tag_constructor(
+                                tag_name=_const.CC_EXTENSION_TAG,
+                                cache_manager=cache_manager,
+                                filepath=filepath,
+                                file_content=file_content,
+                                dependencies=dependencies,
+                                prefetched=prefetched,
+                                documents=documents,
+                            )
+                        },
                     )
-                },
-            )
-        except _ps.exception.read.PySerialsInvalidDataError as e:
-            raise _exception.ControlManInvalidConfigFileDataError(cause=e) from None
+                except _ps.exception.read.PySerialsInvalidDataError as e:
+                    raise _exception.ControlManInvalidConfigFileDataError(cause=e) from None
+            file_cache.set(filepath=filepath, data=data, dependencies=dependencies)
         try:
             log = _ps.update.recursive_update(
                 source=full_data,
@@ -79,19 +124,357 @@ def load(
 
     full_data = {}
     hook_dir = path_cc / _const.DIRNAME_CC_HOOK
-    for path in sorted(path_cc.rglob('*'), key=lambda p: (p.parts, p)):
-        if hook_dir not in path.parents and path.is_file() and path.suffix.lower() in ['.yaml', '.yml']:
-            with _logger.sectioning(_mdit.element.code_span(str(path.relative_to(path_cc)))):
-                _load_file(filepath=path)
+    filepaths = [
+        path for path in sorted(path_cc.rglob('*'), key=lambda p: (p.parts, p))
+        if hook_dir not in path.parents and path.is_file() and path.suffix.lower() in ['.yaml', '.yml']
+    ]
+    file_cache = ParsedFileCache(
+        path=cache_manager.dir_path / _const.FILENAME_PARSED_CONFIG_CACHE if cache_manager and cache_manager.dir_path else None,
+        root_path=path_cc,
+        cache_manager=cache_manager,
+    )
+    cached_data = file_cache.get_all(filepaths)
+    parsed_data = _parse_files_concurrently(
+        filepaths=[path for path in filepaths if path not in cached_data],
+        processes=processes,
+    ) if processes and processes > 1 else {}
+    documents = {}
+    prefetched = _prefetch_external_data(
+        file_contents=[path.read_text() for path in filepaths if path not in cached_data and path not in parsed_data],
+        tag_name=_const.CC_EXTENSION_TAG,
+        cache_manager=cache_manager,
+        max_workers=fetch_workers,
+    )
+    for path in filepaths:
+        with _logger.sectioning(_mdit.element.code_span(str(path.relative_to(path_cc)))):
+            _load_file(filepath=path)
+    file_cache.save(filepaths)
     return full_data
 
 
+class ParsedFileCache:
+    """Cache of parsed control center configuration files.
+
+    Each file is cached with its size, modification time and content hash;
+    a cached file is used when its size and modification time,
+    or otherwise its content hash, are unchanged.
+    Files with `!ext` tags are only used when the cache manager
+    still holds the same data for each of their tags.
+
+    Parameters
+    ----------
+    path
+        Path to the cache file. If `None`, nothing is cached.
+    root_path
+        Path to the control center directory; cached files are keyed by their path relative to it.
+    cache_manager
+        Cache manager holding the external data of `!ext` tags.
+    """
+
+    def __init__(
+        self,
+        path: _Path | None,
+        root_path: _Path,
+        cache_manager: _CacheManager | None = None,
+    ):
+        self._path = path
+        self._root_path = root_path
+        self._cache_manager = cache_manager
+        self._entries: dict[str, dict] = {}
+        self._changed = False
+        if path:
+            try:
+                cache = _pickle.loads(path.read_bytes())
+            except (OSError, _pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+                cache = None
+            if isinstance(cache, dict) and cache.get("key") == _parsed_file_cache_key():
+                self._entries = cache.get("files", {})
+        return
+
+    def get_all(self, filepaths: list[_Path]) -> dict[_Path, dict | list | str | int | float | bool | None]:
+        """Get the parsed data of all unchanged files."""
+        if not self._path:
+            return {}
+        out = {}
+        for filepath in filepaths:
+            entry = self._entries.get(self._key(filepath))
+            if not entry:
+                continue
+            stat = filepath.stat()
+            if entry["size"] != stat.st_size:
+                continue
+            if entry["mtime_ns"] != stat.st_mtime_ns:
+                if entry["hash"] != _hashlib.sha256(filepath.read_bytes()).hexdigest():
+                    continue
+                entry["mtime_ns"] = stat.st_mtime_ns
+                self._changed = True
+            dependencies = entry["dependencies"]
+            if dependencies and not (
+                self._cache_manager and all(
+                    data_hash is not None
+                    and _data_hash(self._cache_manager.get(typ="extension", key=tag_value)) == data_hash
+                    for tag_value, data_hash in dependencies.items()
+                )
+            ):
+                continue
+            out[filepath] = _pickle.loads(entry["data"])
+        return out
+
+    def set(self, filepath: _Path, data, dependencies: dict[str, str]) -> None:
+        """Cache the parsed data of a file.
+
+        Parameters
+        ----------
+        filepath
+            Path to the file.
+        data
+            Parsed data.
+        dependencies
+            Hash of the external data of each `!ext` tag in the file.
+        """
+        if not self._path:
+            return
+        content = filepath.read_bytes()
+        try:
+            data_bytes = _pickle.dumps(data, protocol=_pickle.HIGHEST_PROTOCOL)
+        except (_pickle.PicklingError, TypeError, AttributeError):
+            return
+        self._entries[self._key(filepath)] = {
+            "size": len(content),
+            "mtime_ns": filepath.stat().st_mtime_ns,
+            "hash": _hashlib.sha256(content).hexdigest(),
+            "dependencies": dependencies,
+            "data": data_bytes,
+        }
+        self._changed = True
+        return
+
+    def save(self, filepaths: list[_Path]) -> None:
+        """Write the cache to disk, dropping entries of files not in `filepaths`."""
+        if not self._path:
+            return
+        keys = {self._key(filepath) for filepath in filepaths}
+        for key in self._entries.keys() - keys:
+            self._entries.pop(key)
+            self._changed = True
+        if not self._changed:
+            return
+        temp_path = self._path.with_name(f"{self._path.name}.{_os.getpid()}.tmp")
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(
+                _pickle.dumps(
+                    {"key": _parsed_file_cache_key(), "files": self._entries},
+                    protocol=_pickle.HIGHEST_PROTOCOL,
+                )
+            )
+            _os.replace(temp_path, self._path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            return
+        self._changed = False
+        return
+
+    def _key(self, filepath: _Path) -> str:
+        return filepath.relative_to(self._root_path).as_posix()
+
+
+def _parsed_file_cache_key() -> str:
+    """Versions of the packages that determine the parsed data."""
+    versions = []
+    for dist_name in ("ControlMan", "PySerials", "ruamel.yaml"):
+        try:
+            versions.append(f"{dist_name}=={_importlib_metadata.version(dist_name)}")
+        except _importlib_metadata.PackageNotFoundError:
+            versions.append(dist_name)
+    return "\n".join(versions)
+
+
+def _data_hash(data) -> str | None:
+    if data is None:
+        return
+    try:
+        return _hashlib.sha256(_pickle.dumps(data, protocol=_pickle.HIGHEST_PROTOCOL)).hexdigest()
+    except (_pickle.PicklingError, TypeError, AttributeError):
+        return
+
+
+def _parse_files_concurrently(filepaths: list[_Path], processes: int) -> dict[_Path, dict]:
+    """Parse YAML files in a pool of worker processes.
+
+    Empty files and files with `!ext` tags are skipped,
+    since they need the main process (for logging, cache and network access).
+
+    Returns
+    -------
+    dict
+        Parsed data of each successfully parsed file.
+    """
+    file_contents = {}
+    for filepath in filepaths:
+        file_content = filepath.read_text()
+        if file_content.strip() and _const.CC_EXTENSION_TAG not in file_content:
+            file_contents[filepath] = file_content
+    if not file_contents:
+        return {}
+    with _ProcessPoolExecutor(max_workers=min(processes, len(file_contents))) as executor:
+        results = list(executor.map(_parse_yaml_string, file_contents.values()))
+    return {
+        filepath: data for filepath, (success, data) in zip(file_contents, results) if success
+    }
+
+
+def _parse_yaml_string(data: str) -> tuple[bool, dict | list | str | int | float | bool | None]:
+    try:
+        return True, _ps.read.yaml_from_string(data=data, safe=True)
+    except Exception:
+        # Parsed again in the main process to raise the usual error.
+        return False, None
+
+
+def _prefetch_external_data(
+    file_contents: list[str],
+    tag_name: str,
+    cache_manager: _CacheManager | None,
+    max_workers: int,
+) -> dict[tuple[str, str | None, str | None], _ExternalResponse | _WebAPIError]:
+    """Fetch the documents of all external tags concurrently.
+
+    Tags are collected from the given file contents and, recursively,
+    from fetched YAML documents. Tags with cached data are skipped,
+    tags with expired cached data are revalidated with conditional requests,
+    and each distinct request is only sent once.
+
+    Returns
+    -------
+    dict
+        The response to each request, keyed by the URL, ETag and Last-Modified value it was sent with,
+        or the error raised when sending it.
+    """
+    fetched = {}
+    requests = _find_external_requests(file_contents=file_contents, tag_name=tag_name, cache_manager=cache_manager)
+    if not requests:
+        return fetched
+    with _ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while requests:
+            results = dict(zip(requests, executor.map(lambda request: _fetch_external_data(*request), requests)))
+            fetched.update(results)
+            nested_contents = [
+                response.content for (url, _, _), response in results.items()
+                if isinstance(response, _ExternalResponse)
+                and response.content is not None
+                and url.split('.')[-1].lower() in ("yaml", "yml")
+            ]
+            requests = list(
+                _find_external_requests(file_contents=nested_contents, tag_name=tag_name, cache_manager=cache_manager)
+                - fetched.keys()
+            )
+    _request_scheduler.scheduler.flush_log()
+    return fetched
+
+
+def _find_external_requests(
+    file_contents: list[str],
+    tag_name: str,
+    cache_manager: _CacheManager | None,
+) -> set[tuple[str, str | None, str | None]]:
+    requests = set()
+    for file_content in file_contents:
+        if tag_name not in file_content:
+            continue
+        try:
+            events = list(_yaml.YAML(typ="safe", pure=True).parse(file_content))
+        except _yaml.YAMLError:
+            # Invalid files are reported when they are loaded.
+            continue
+        for event in events:
+            if not isinstance(event, _yaml.events.ScalarEvent) or event.tag != tag_name or not event.value:
+                continue
+            url = event.value.split(' ', 1)[0]
+            if cache_manager and (
+                cache_manager.get(typ="extension", key=event.value)
+                or (url != event.value and cache_manager.get(typ="extension", key=url))
+            ):
+                continue
+            stale = cache_manager.get_stale(typ="extension", key=url) if cache_manager else None
+            _, etag, last_modified = stale or (None, None, None)
+            requests.add((url, etag, last_modified))
+    return requests
+
+
+class _ExternalResponse(_NamedTuple):
+    content: str | None
+    """Response text, or `None` if the document was not modified."""
+    etag: str | None
+    last_modified: str | None
+
+
+def _fetch_external_data(
+    url: str,
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> _ExternalResponse | _WebAPIError:
+    """Fetch a document, conditionally if the ETag or Last-Modified value of a cached version is given."""
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    try:
+        response = _request_scheduler.scheduler.request(url=url, verb="GET", headers=headers or None)
+    except _WebAPIError as e:
+        return e
+    return _ExternalResponse(
+        content=None if response.status_code == 304 else response.text,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+    )
+
+
 def _create_external_tag_constructor(
     filepath: _Path,
     file_content: str,
     tag_name: str = u"!ext",
-    cache_manager: _CacheManager | None = None
+    cache_manager: _CacheManager | None = None,
+    dependencies: dict[str, str | None] | None = None,
+    prefetched: dict[tuple[str, str | None, str | None], _ExternalResponse | _WebAPIError] | None = None,
+    documents: dict[str, dict | list | str | int | float | bool | None] | None = None,
 ):
+    """Create a YAML constructor resolving external tags.
+
+    Parameters
+    ----------
+    dependencies
+        Dictionary to record the hash of the data resolved for each tag.
+    prefetched
+        Responses of prefetched requests (see `_prefetch_external_data`).
+    documents
+        Dictionary of parsed documents by URL, shared between constructors,
+        so that each document is only parsed once, no matter how many tags extract data from it.
+    """
+    if documents is None:
+        documents = {}
+
+    def extract(document, url: str, jsonpath_expr: list[str]):
+        if not jsonpath_expr:
+            return _copy.deepcopy(document)
+        try:
+            data = _ps.update.TemplateFiller().fill(
+                data=document,
+                template=jsonpath_expr,
+            )
+        except Exception as e:
+            raise ValueError(
+                f"No match found for JSONPath '{jsonpath_expr}' in the JSON data from '{url}'")
+        # Extracted data may share objects with the document, which is reused for other tags.
+        return _copy.deepcopy(data)
+
+    def resolved(tag_value: str, data):
+        if cache_manager:
+            cache_manager.set(typ="extension", key=tag_value, value=data)
+        if dependencies is not None:
+            dependencies[tag_value] = _data_hash(data)
+        return data
 
     def load_external_data(loader: _yaml.SafeConstructor, node: _yaml.ScalarNode):
 
@@ -105,23 +488,42 @@ def _create_external_tag_constructor(
         if cache_manager:
             cached_data = cache_manager.get(typ="extension", key=tag_value)
             if cached_data:
+                if dependencies is not None:
+                    dependencies[tag_value] = _data_hash(cached_data)
                 return cached_data
         url, *jsonpath_expr = tag_value.split(' ', 1)
         file_ext = url.split('.')[-1].lower()
-        try:
-            data_raw_whole = _pl.http.request(
-                url=url,
-                verb="GET",
-                response_type="str",
-            )
-        except _WebAPIError as e:
+        if url in documents:
+            return resolved(tag_value, extract(documents[url], url, jsonpath_expr))
+        if jsonpath_expr and cache_manager:
+            # The whole document is cached under its URL.
+            cached_document = cache_manager.get(typ="extension", key=url)
+            if cached_document:
+                documents[url] = cached_document
+                return resolved(tag_value, extract(cached_document, url, jsonpath_expr))
+        stale = cache_manager.get_stale(typ="extension", key=url) if cache_manager else None
+        stale_data, etag, last_modified = stale or (None, None, None)
+        response = prefetched.get((url, etag, last_modified)) if prefetched else None
+        if response is None:
+            response = _fetch_external_data(url=url, etag=etag, last_modified=last_modified)
+        if isinstance(response, _WebAPIError):
             raise _exception.ControlManUnreachableTagInConfigFileError(
                 filepath=filepath,
                 data=file_content,
                 node=node,
                 url=url,
-                cause=e,
+                cause=response,
             ) from None
+        if response.content is None:
+            # Not modified since cached; the expired document is still valid.
+            cache_manager.renew(typ="extension", key=url)
+            documents[url] = stale_data
+            if not jsonpath_expr:
+                if dependencies is not None:
+                    dependencies[tag_value] = _data_hash(stale_data)
+                return stale_data
+            return resolved(tag_value, extract(stale_data, url, jsonpath_expr))
+        data_raw_whole = response.content
         if file_ext == "json":
             data = _ps.read.json_from_string(data=data_raw_whole, strict=False)
         elif file_ext in ("yaml", "yml"):
@@ -134,17 +536,19 @@ def _create_external_tag_constructor(
             data = _ps.read.toml_from_string(data=data_raw_whole, as_dict=True)
         else:
             raise ValueError(f"Invalid file extension {file_ext} for URL {url}")
-        if jsonpath_expr:
-            try:
-                data = _ps.update.TemplateFiller().fill(
-                    data=data,
-                    template=jsonpath_expr,
-                )
-            except Exception as e:
-                raise ValueError(
-                    f"No match found for JSONPath '{jsonpath_expr}' in the JSON data from '{url}'")
+        documents[url] = data
         if cache_manager:
-            cache_manager.set(typ="extension", key=tag_value, value=data)
-        return data
+            cache_manager.set(
+                typ="extension",
+                key=url,
+                value=data,
+                etag=response.etag,
+                last_modified=response.last_modified,
+            )
+        if not jsonpath_expr:
+            if dependencies is not None:
+                dependencies[tag_value] = _data_hash(data)
+            return data
+        return resolved(tag_value, extract(data, url, jsonpath_expr))
 
     return load_external_data
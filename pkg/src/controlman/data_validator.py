@@ -1,7 +1,17 @@
-from typing import Literal as _Literal
+from typing import Literal as _Literal, Sequence as _Sequence
 from pathlib import Path as _Path
 import copy
 import re as _re
+import functools as _functools
+import os as _os
+import pickle as _pickle
+import json as _json
+import hashlib as _hashlib
+import importlib.metadata as _importlib_metadata
+import sys as _sys
+import datetime as _datetime
+import itertools as _itertools
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
 
 import trove_classifiers as _trove_classifiers
 import jsonschema as _jsonschema
@@ -14,9 +24,24 @@ from mdit.data import schema as _mdit_schema
 from loggerman import logger as _logger
 
 from controlman import exception as _exception, const as _const
+from controlman._schema_compiler import CompiledSchema as _CompiledSchema
 
 
 _schema_dir_path = _pkgdata.get_package_path_from_caller(top_level=True) / "_data" / "schema"
+_specifications = {
+    spec.name: spec for spec in (
+        _referencing_jsonschema.DRAFT202012,
+        _referencing_jsonschema.DRAFT201909,
+        _referencing_jsonschema.DRAFT7,
+        _referencing_jsonschema.DRAFT6,
+        _referencing_jsonschema.DRAFT4,
+        _referencing_jsonschema.DRAFT3,
+    )
+}
+_MAX_VALIDATION_MARKERS = 256
+"""Maximum number of validated metadata records to keep; see `validate_metadata`."""
+_SCHEMA_SECTIONS = "main-sections"
+"""Internal variant of the main schema validating top-level keys independently; see `_make_sections_schema`."""
 
 
 def get_schema(
@@ -34,29 +59,40 @@ def validate(
     source: _Literal["source", "compiled"] = "compiled",
     before_substitution: bool = False,
     fill_defaults: bool = True,
+    backend: _Literal["jsonschema", "compiled"] = "jsonschema",
+    processes: int | None = None,
 ) -> None:
-    """Validate data against a schema."""
-    schema_dict = get_schema(schema=schema)
-    _js.edit.required_last(schema_dict)
-    if schema == "main":
-        _add_custom_keys(schema_dict)
-    if before_substitution:
-        schema_dict = modify_schema(schema_dict)["anyOf"][0]
-    try:
-        _ps.validate.jsonschema(
+    """Validate data against a schema.
+
+    Parameters
+    ----------
+    backend
+        With `compiled`, the data is first checked by a validator compiled from the schema
+        (see `get_compiled_validator`), and the regular `jsonschema` validator only runs
+        to report errors when that check fails.
+    processes
+        Number of worker processes to validate the top-level sections
+        of the main schema concurrently. By default, sections are validated sequentially.
+        Errors of all sections are reported together in data order.
+    """
+    if processes and processes > 1 and schema == "main" and isinstance(data, dict) and len(data) > 1:
+        _validate_sections(
             data=data,
-            schema=schema_dict,
-            validator=_jsonschema.Draft202012Validator,
-            registry=_registry_before if before_substitution else _registry_after,
+            source=source,
+            before_substitution=before_substitution,
             fill_defaults=fill_defaults,
-            iter_errors=True,
+            backend=backend,
+            processes=processes,
         )
-    except _ps.exception.validate.PySerialsJsonSchemaValidationError as e:
-        raise _exception.load.ControlManSchemaValidationError(
+    else:
+        _validate_schema(
+            data=data,
+            schema=schema,
             source=source,
             before_substitution=before_substitution,
-            cause=e,
-        ) from None
+            fill_defaults=fill_defaults,
+            backend=backend,
+        )
     if schema == "main" and not before_substitution:
         DataValidator(data=data, source=source).validate()
     _logger.success(
@@ -66,31 +102,138 @@ def validate(
     return
 
 
+def validate_many(
+    data: _Sequence[dict | list | str | int | float | bool],
+    schema: _Literal["main", "local", "cache", "entity", "variables", "changelog", "contributors"] = "main",
+    source: _Literal["source", "compiled"] = "compiled",
+    before_substitution: bool = False,
+    fill_defaults: bool = True,
+    backend: _Literal["jsonschema", "compiled"] = "jsonschema",
+) -> None:
+    """Validate a batch of data items against the same schema.
+
+    The prepared validator is fetched once for the whole batch,
+    and the regular `jsonschema` validator only runs for the first invalid item
+    when using the `compiled` backend.
+    Unlike `validate`, no cross-field checks are performed.
+    """
+    if backend == "compiled":
+        compiled = get_compiled_validator(
+            schema=schema, before_substitution=before_substitution, fill_defaults=fill_defaults
+        )
+        invalid_items = [item for item in data if not compiled.is_valid(item)]
+    else:
+        invalid_items = data
+    if invalid_items:
+        validator = get_validator(schema=schema, before_substitution=before_substitution, fill_defaults=fill_defaults)
+        for item in invalid_items:
+            _raise_for_errors(data=item, validator=validator, source=source, before_substitution=before_substitution)
+    _logger.success(
+        "Validated Schema",
+        f"All {len(data)} data items have been successfully validated against the schema.",
+    )
+    return
+
+
+def validate_metadata(
+    data: dict,
+    source: _Literal["source", "compiled"] = "compiled",
+    strict: bool = False,
+) -> None:
+    """Validate project metadata against the main schema, without filling defaults.
+
+    Successful validations are recorded on disk, keyed by a hash of the data
+    and of the schemas, so validating identical metadata again is skipped.
+    Only the most recently used records are kept.
+
+    Parameters
+    ----------
+    data
+        Project metadata.
+    source
+        Source of the data.
+    strict
+        Always validate the data, even when identical data has already been validated.
+    """
+    marker_path = _user_cache_dir() / "validated" / _metadata_hash(data)
+    if not strict and marker_path.is_file():
+        try:
+            # Mark as recently used.
+            marker_path.touch()
+        except OSError:
+            pass
+        _logger.success(
+            "Validated Schema",
+            "Identical data has already been successfully validated against the schema.",
+        )
+        return
+    validate(data=data, source=source, fill_defaults=False)
+    try:
+        marker_path.parent.mkdir(parents=True, exist_ok=True)
+        marker_path.touch()
+    except OSError:
+        return
+    _prune_validation_markers(marker_path.parent)
+    return
+
+
+def _prune_validation_markers(dir_path: _Path) -> None:
+    """Remove the least recently used validation records exceeding `_MAX_VALIDATION_MARKERS`."""
+    markers = []
+    for marker in dir_path.iterdir():
+        try:
+            markers.append((marker.stat().st_mtime, marker))
+        except OSError:
+            # Removed by a concurrent process.
+            continue
+    if len(markers) <= _MAX_VALIDATION_MARKERS:
+        return
+    markers.sort(reverse=True)
+    for _, marker in markers[_MAX_VALIDATION_MARKERS:]:
+        marker.unlink(missing_ok=True)
+    return
+
+
 def validate_user_schema(
     data: dict | list | str | int | float | bool,
     schema: dict,
     before_substitution: bool,
     fill_defaults: bool,
+    cache_dir: _Path | None = None,
 ) -> None:
-    """Validate data against a schema."""
-    _js.edit.required_last(schema)
-    if before_substitution:
-        schema = modify_schema(schema)["anyOf"][0]
-    try:
-        _ps.validate.jsonschema(
-            data=data,
-            schema=schema,
-            validator=_jsonschema.Draft202012Validator,
-            registry=_registry_before if before_substitution else _registry_after,
+    """Validate data against a user-defined schema.
+
+    The schema is prepared on a copy and compiled once for each distinct schema;
+    compiled validators are cached in memory, keyed by a fingerprint of the schema,
+    and in `cache_dir` (if given) to be reused across runs.
+    The regular `jsonschema` validator only runs to report errors.
+    """
+    fingerprint = _subtree_hash(schema)
+    key = None if fingerprint is None else _hashlib.sha256(
+        f"{fingerprint}|{_registry_snapshot_key()}|{_sys.version}|{before_substitution}|{fill_defaults}".encode()
+    ).hexdigest()
+    cached = _user_schema_validators.get(key) if key else None
+    if cached:
+        prepared_schema, compiled = cached
+    else:
+        prepared_schema = copy.deepcopy(schema)
+        _js.edit.required_last(prepared_schema)
+        if before_substitution:
+            prepared_schema = modify_schema(prepared_schema)["anyOf"][0]
+        compiled = _load_compiled_validator(
+            path=cache_dir / _const.DIRNAME_COMPILED_SCHEMAS / f"{key}.pickle" if cache_dir and key else None,
+            schema=prepared_schema,
+            before_substitution=before_substitution,
             fill_defaults=fill_defaults,
-            iter_errors=True,
         )
-    except _ps.exception.validate.PySerialsJsonSchemaValidationError as e:
-        raise _exception.load.ControlManSchemaValidationError(
-            source="source",
-            before_substitution=before_substitution,
-            cause=e,
-        ) from None
+        if key:
+            _user_schema_validators[key] = (prepared_schema, compiled)
+    if not compiled.is_valid(data):
+        validator = _get_validator_class(fill_defaults=fill_defaults)(
+            prepared_schema,
+            registry=_get_registry(before_substitution=before_substitution),
+        )
+        _raise_for_errors(data=data, validator=validator, source="source", before_substitution=before_substitution)
     _logger.success(
         "Validated User Schema",
         "The data has been successfully validated against the schema.",
@@ -98,6 +241,380 @@ def validate_user_schema(
     return
 
 
+def get_validator(
+    schema: _Literal["main", "local", "cache", "entity", "variables", "changelog", "contributors"] = "main",
+    before_substitution: bool = False,
+    fill_defaults: bool = True,
+) -> _jsonschema.protocols.Validator:
+    """Get the validator for a schema.
+
+    The schema is prepared and its validator is constructed only once
+    for each combination of arguments; subsequent calls return the cached validator.
+    Use `clear_cache` to discard cached validators.
+    """
+    key = (schema, before_substitution, fill_defaults)
+    validator = _validators.get(key)
+    if validator is None:
+        validator = _get_validator_class(fill_defaults=fill_defaults)(
+            _get_prepared_schema(schema=schema, before_substitution=before_substitution),
+            registry=_get_registry(before_substitution=before_substitution),
+        )
+        _validators[key] = validator
+    return validator
+
+
+def get_compiled_validator(
+    schema: _Literal["main", "local", "cache", "entity", "variables", "changelog", "contributors"] = "main",
+    before_substitution: bool = False,
+    fill_defaults: bool = True,
+) -> _CompiledSchema:
+    """Get the compiled validator for a schema.
+
+    The compiled validator gives the same result and fills the same defaults
+    as the validator returned by `get_validator`, but does not report errors.
+    Since compiling large schemas is expensive, compiled validators
+    are cached in memory and in the user cache directory,
+    keyed by the same hash as the registry snapshots.
+    """
+    key = (schema, before_substitution, fill_defaults)
+    compiled = _compiled_validators.get(key)
+    if compiled is not None:
+        return compiled
+    compiled = _load_compiled_validator(
+        path=_user_cache_dir() / _const.DIRNAME_COMPILED_SCHEMAS / f"{_compiled_validator_key(*key)}.pickle",
+        schema=_get_prepared_schema(schema=schema, before_substitution=before_substitution),
+        before_substitution=before_substitution,
+        fill_defaults=fill_defaults,
+    )
+    _compiled_validators[key] = compiled
+    return compiled
+
+
+def _load_compiled_validator(
+    path: _Path | None,
+    schema: dict,
+    before_substitution: bool,
+    fill_defaults: bool,
+) -> _CompiledSchema:
+    """Load a compiled validator from `path`, or compile the schema and save it there."""
+    registry = _get_registry(before_substitution=before_substitution)
+    validator_class = _get_validator_class(fill_defaults=fill_defaults)
+    if path:
+        try:
+            return _CompiledSchema.from_data(
+                data=_pickle.loads(path.read_bytes()),
+                schema=schema,
+                registry=registry,
+                validator_class=validator_class,
+            )
+        except (OSError, _pickle.UnpicklingError, EOFError, AttributeError, ImportError, KeyError, TypeError, ValueError):
+            pass
+    compiled = _CompiledSchema.from_schema(
+        schema=schema,
+        registry=registry,
+        validator_class=validator_class,
+        fill_defaults=fill_defaults,
+    )
+    if path:
+        try:
+            compiled_bytes = _pickle.dumps(compiled.data, protocol=_pickle.HIGHEST_PROTOCOL)
+        except (_pickle.PicklingError, TypeError):
+            pass
+        else:
+            _write_atomic(path=path, content=compiled_bytes)
+    return compiled
+
+
+def clear_cache() -> None:
+    """Discard all cached schemas, validators and registries.
+
+    This is only needed when schema files are modified during the lifetime of the process.
+    """
+    _schemas.clear()
+    _validators.clear()
+    _compiled_validators.clear()
+    _user_schema_validators.clear()
+    _registries.clear()
+    _registry_snapshot_key.cache_clear()
+    return
+
+
+def _get_prepared_schema(
+    schema: _Literal["main", "local", "cache", "entity", "variables", "changelog", "contributors"],
+    before_substitution: bool,
+) -> dict:
+    key = (schema, before_substitution)
+    schema_dict = _schemas.get(key)
+    if schema_dict is None and schema == _SCHEMA_SECTIONS:
+        schema_dict = _make_sections_schema(_get_prepared_schema(schema="main", before_substitution=before_substitution))
+        _schemas[key] = schema_dict
+    elif schema_dict is None:
+        schema_dict = get_schema(schema=schema)
+        _js.edit.required_last(schema_dict)
+        if schema == "main":
+            _add_custom_keys(schema_dict)
+        if before_substitution:
+            schema_dict = modify_schema(schema_dict)["anyOf"][0]
+        _schemas[key] = schema_dict
+    return schema_dict
+
+
+def _make_sections_schema(schema: dict) -> dict:
+    """Make a schema validating any subset of the top-level keys of the main schema.
+
+    Each top-level key is validated only against its own subschema;
+    required top-level keys are not enforced, and missing top-level keys
+    are not filled with default values. Defaults inside each key are still filled.
+    """
+    sections_schema = {key: value for key, value in schema.items() if key not in ("$id", "required")}
+    sections_schema["properties"] = {
+        key: {subkey: value for subkey, value in subschema.items() if subkey != "default"}
+        for key, subschema in schema.get("properties", {}).items()
+    }
+    return sections_schema
+
+
+@_functools.cache
+def _get_validator_class(fill_defaults: bool) -> type[_jsonschema.protocols.Validator]:
+    validator_class = _jsonschema.Draft202012Validator
+    if not fill_defaults:
+        return validator_class
+    validate_properties = validator_class.VALIDATORS["properties"]
+
+    def set_defaults(validator, properties, instance, schema):
+        # The entire dict instance may be templated
+        if isinstance(instance, dict):
+            for prop, subschema in properties.items():
+                if "default" in subschema and prop not in instance:
+                    # Defaults are copied since schemas are cached and shared between validations.
+                    instance[prop] = copy.deepcopy(subschema["default"])
+        yield from validate_properties(validator, properties, instance, schema)
+
+    return _jsonschema.validators.extend(validator_class, {"properties": set_defaults})
+
+
+def _validate_schema(
+    data: dict | list | str | int | float | bool,
+    schema: _Literal["main", "local", "cache", "entity", "variables", "changelog", "contributors"],
+    source: _Literal["source", "compiled"],
+    before_substitution: bool,
+    fill_defaults: bool,
+    backend: _Literal["jsonschema", "compiled"],
+) -> None:
+    if backend == "compiled" and get_compiled_validator(
+        schema=schema, before_substitution=before_substitution, fill_defaults=fill_defaults
+    ).is_valid(data):
+        return
+    validator = get_validator(schema=schema, before_substitution=before_substitution, fill_defaults=fill_defaults)
+    _raise_for_errors(data=data, validator=validator, source=source, before_substitution=before_substitution)
+    return
+
+
+def _validate_sections(
+    data: dict,
+    source: _Literal["source", "compiled"],
+    before_substitution: bool,
+    fill_defaults: bool,
+    backend: _Literal["jsonschema", "compiled"],
+    processes: int,
+    keys: list[str] | None = None,
+) -> None:
+    """Validate each top-level key of the data against its own subschema
+    in the main schema, in a pool of worker processes.
+
+    Sections with filled default values are written back into the data.
+    Failing sections are then validated together in this process to report their errors.
+
+    Parameters
+    ----------
+    keys
+        Top-level keys to validate. By default, the data is validated as a whole,
+        i.e., required top-level keys are enforced and missing top-level keys
+        are filled with their default values.
+    """
+    if keys is None:
+        schema = _get_prepared_schema(schema="main", before_substitution=before_substitution)
+        if any(key not in data for key in schema.get("required", [])):
+            _validate_schema(
+                data=data,
+                schema="main",
+                source=source,
+                before_substitution=before_substitution,
+                fill_defaults=fill_defaults,
+                backend="jsonschema",
+            )
+        if fill_defaults:
+            for key, subschema in schema.get("properties", {}).items():
+                if "default" in subschema and key not in data:
+                    data[key] = copy.deepcopy(subschema["default"])
+        keys = list(data.keys())
+    config = (before_substitution, fill_defaults, backend)
+    # Load validators before starting the pool; forked workers inherit them,
+    # and other workers load them from the on-disk caches created here.
+    _load_section_validator(*config)
+    with _ProcessPoolExecutor(
+        max_workers=min(processes, len(keys)),
+        initializer=_load_section_validator,
+        initargs=config,
+    ) as executor:
+        results = list(
+            executor.map(
+                _validate_section,
+                keys,
+                [data[key] for key in keys],
+                *(_itertools.repeat(arg) for arg in config),
+            )
+        )
+    invalid_keys = []
+    for key, (value, is_valid) in zip(keys, results):
+        data[key] = value
+        if not is_valid:
+            invalid_keys.append(key)
+    if invalid_keys:
+        _validate_schema(
+            data={key: data[key] for key in invalid_keys},
+            schema=_SCHEMA_SECTIONS,
+            source=source,
+            before_substitution=before_substitution,
+            fill_defaults=fill_defaults,
+            backend="jsonschema",
+        )
+    return
+
+
+def _load_section_validator(
+    before_substitution: bool,
+    fill_defaults: bool,
+    backend: _Literal["jsonschema", "compiled"],
+) -> None:
+    if backend == "compiled":
+        get_compiled_validator(
+            schema=_SCHEMA_SECTIONS, before_substitution=before_substitution, fill_defaults=fill_defaults
+        )
+    else:
+        get_validator(schema=_SCHEMA_SECTIONS, before_substitution=before_substitution, fill_defaults=fill_defaults)
+    return
+
+
+def _validate_section(
+    key: str,
+    value,
+    before_substitution: bool,
+    fill_defaults: bool,
+    backend: _Literal["jsonschema", "compiled"],
+) -> tuple:
+    section_data = {key: value}
+    if backend == "compiled":
+        validator = get_compiled_validator(
+            schema=_SCHEMA_SECTIONS, before_substitution=before_substitution, fill_defaults=fill_defaults
+        )
+        is_valid = validator.is_valid(section_data)
+    else:
+        validator = get_validator(
+            schema=_SCHEMA_SECTIONS, before_substitution=before_substitution, fill_defaults=fill_defaults
+        )
+        is_valid = next(validator.iter_errors(section_data), None) is None
+    return section_data[key], is_valid
+
+
+def _raise_for_errors(
+    data: dict | list | str | int | float | bool,
+    validator: _jsonschema.protocols.Validator,
+    source: _Literal["source", "compiled"],
+    before_substitution: bool,
+) -> None:
+    errors = list(validator.iter_errors(data))
+    if not errors:
+        return
+    cause = _ps.exception.validate.PySerialsJsonSchemaValidationError(
+        causes=errors,
+        data=data,
+        schema=validator.schema,
+        validator=validator,
+        registry=_get_registry(before_substitution=before_substitution),
+    )
+    raise _exception.load.ControlManSchemaValidationError(
+        source=source,
+        before_substitution=before_substitution,
+        cause=cause,
+    ) from None
+
+
+class SubtreeValidator:
+    """Validate data against the main schema repeatedly,
+    re-validating only the top-level subtrees that changed since the last successful validation.
+
+    The main schema constrains each top-level key independently,
+    so unchanged subtrees are known to be valid and are skipped.
+    Changes are detected by comparing hashes of the subtrees.
+
+    Parameters
+    ----------
+    source
+        Source of the data, used in error reports.
+    before_substitution
+        Validate against the schema used before template substitution.
+    fill_defaults
+        Fill missing properties with their default values.
+    backend
+        Validator backend; see `validate`.
+    processes
+        Number of worker processes to validate top-level keys concurrently; see `validate`.
+    """
+
+    def __init__(
+        self,
+        source: _Literal["source", "compiled"] = "compiled",
+        before_substitution: bool = False,
+        fill_defaults: bool = True,
+        backend: _Literal["jsonschema", "compiled"] = "jsonschema",
+        processes: int | None = None,
+    ):
+        self._source = source
+        self._before_substitution = before_substitution
+        self._fill_defaults = fill_defaults
+        self._backend = backend
+        self._processes = processes
+        self._hashes: dict[str, str | None] = {}
+        return
+
+    def validate(self, data: dict) -> None:
+        hashes = {key: _subtree_hash(value) for key, value in data.items()}
+        if self._hashes:
+            changed = [key for key, hash_ in hashes.items() if hash_ is None or self._hashes.get(key) != hash_]
+        else:
+            changed = list(data.keys())
+        config = {
+            "source": self._source,
+            "before_substitution": self._before_substitution,
+            "fill_defaults": self._fill_defaults,
+            "backend": self._backend,
+        }
+        if self._processes and self._processes > 1 and len(changed) > 1:
+            _validate_sections(
+                data=data, processes=self._processes, keys=changed if self._hashes else None, **config
+            )
+        elif self._hashes:
+            # Changed keys are validated against their own subschemas only,
+            # without filling defaults for the unchanged keys missing from the partial data.
+            partial_data = {key: data[key] for key in changed}
+            _validate_schema(data=partial_data, schema=_SCHEMA_SECTIONS, **config)
+            data.update(partial_data)
+        else:
+            _validate_schema(data=data, schema="main", **config)
+        if not self._before_substitution:
+            DataValidator(data=data, source=self._source).validate()
+        self._hashes = hashes | {
+            key: _subtree_hash(value) for key, value in data.items() if key in changed or key not in hashes
+        }
+        _logger.success(
+            "Validated Schema",
+            f"The data has been successfully validated against the schema; "
+            f"{len(changed)} of {len(data)} top-level keys were (re)validated.",
+        )
+        return
+
+
 class DataValidator:
     def __init__(self, data: dict, source: _Literal["source", "compiled"] = "compiled"):
         self._data = _ps.nested_dict.NestedDict(data)
@@ -263,16 +780,18 @@ class DataValidator:
         for branch_key, branch_data in self._data["branch"].items():
             branch_keys.append(branch_key)
             branch_names.append(branch_data["name"])
-        for idx, branch_name in enumerate(branch_names):
-            for idx2, branch_name2 in enumerate(branch_names[idx + 1:]):
-                if branch_name.startswith(branch_name2) or branch_name2.startswith(branch_name):
-                    raise _exception.load.ControlManSchemaValidationError(
-                        source=self._source,
-                        problem=f"Branch name '{branch_name}' defined at 'branch.{branch_keys[idx]}' "
-                        f"overlaps with branch name '{branch_name2}' defined at 'branch.{branch_keys[idx + idx2 + 1]}'.",
-                        json_path=branch_keys[idx],
-                        data=self._data(),
-                    )
+        overlaps = _find_prefix_overlaps(branch_names)
+        if overlaps:
+            raise _exception.load.ControlManSchemaValidationError(
+                source=self._source,
+                problem=" ".join(
+                    f"Branch name '{branch_names[idx]}' defined at 'branch.{branch_keys[idx]}' "
+                    f"overlaps with branch name '{branch_names[idx2]}' defined at 'branch.{branch_keys[idx2]}'."
+                    for idx, idx2 in overlaps
+                ),
+                json_path=f"branch.{branch_keys[overlaps[0][0]]}",
+                data=self._data(),
+            )
         return
 
     def changelogs(self):
@@ -468,18 +987,19 @@ class DataValidator:
     def labels(self):
         """Verify that label names and prefixes are unique."""
         labels = []
+        label_infos = []
         for main_type in ("auto_group", "group", "single"):
             for label_id, label_data in self._data["label"].get(main_type, {}).items():
-                label = label_data["name"] if main_type == "single" else label_data["prefix"]
-                label_type = "name" if main_type == "single" else "prefix"
-                for set_label in labels:
-                    if set_label.startswith(label) or label.startswith(set_label):
-                        _logger.critical(
-                            f"Ambiguous label {label_type}: {label}",
-                            f"The {label_type} '{label}' set for label '{main_type}.{label_id}' "
-                            f"is ambiguous as it overlaps with the already set name/prefix '{set_label}'.",
-                        )
-                labels.append(label)
+                labels.append(label_data["name"] if main_type == "single" else label_data["prefix"])
+                label_infos.append((main_type, label_id, "name" if main_type == "single" else "prefix"))
+        for set_idx, idx in sorted(_find_prefix_overlaps(labels), key=lambda overlap: overlap[::-1]):
+            label = labels[idx]
+            main_type, label_id, label_type = label_infos[idx]
+            _logger.critical(
+                f"Ambiguous label {label_type}: {label}",
+                f"The {label_type} '{label}' set for label '{main_type}.{label_id}' "
+                f"is ambiguous as it overlaps with the already set name/prefix '{labels[set_idx]}'.",
+            )
         if len(labels) > 1000:
             _logger.critical(
                 f"Too many labels: {len(labels)}",
@@ -499,6 +1019,29 @@ class DataValidator:
         return
 
 
+def _find_prefix_overlaps(strings: _Sequence[str]) -> list[tuple[int, int]]:
+    """Find all pairs of strings where one string is a prefix of the other.
+
+    In sorted order, all strings starting with a given string directly follow it,
+    so each string is only compared with the strings it overlaps and one more.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        Sorted pairs of indices `(i, j)` with `i < j` of overlapping strings.
+    """
+    order = sorted(range(len(strings)), key=strings.__getitem__)
+    overlaps = []
+    for position, idx in enumerate(order):
+        string = strings[idx]
+        next_position = position + 1
+        while next_position < len(order) and strings[order[next_position]].startswith(string):
+            idx2 = order[next_position]
+            overlaps.append((min(idx, idx2), max(idx, idx2)))
+            next_position += 1
+    return sorted(overlaps)
+
+
 def modify_schema(schema: dict) -> dict:
     schema.pop("$schema", None)  # see: https://github.com/python-jsonschema/jsonschema/issues/1295
     for key in ("properties", "patternProperties"):
@@ -526,45 +1069,199 @@ def modify_schema(schema: dict) -> dict:
     return new_schema
 
 
-def _make_registry():
+def warm_registry(before_substitution: bool = True, after_substitution: bool = True) -> None:
+    """Build the schema registries ahead of time.
 
-    def make_resource(
-        schema: dict, spec: _referencing.Specification = _referencing_jsonschema.DRAFT202012
-    ) -> _referencing.Resource:
-        return _referencing.Resource.from_contents(schema, default_specification=spec)
+    Registries are otherwise built lazily on first use;
+    long-running processes can call this at startup
+    to move the cost out of the first validation.
 
+    Parameters
+    ----------
+    before_substitution
+        Build the registry used for validation before template substitution.
+    after_substitution
+        Build the registry used for validation after template substitution.
+    """
+    if after_substitution:
+        _get_registry(before_substitution=False)
+    if before_substitution:
+        _get_registry(before_substitution=True)
+    return
+
+
+def _get_registry(before_substitution: bool) -> _referencing.Registry:
+    """Get the before- or after-substitution registry, building it on first request.
+
+    Each registry is loaded from its snapshot if available,
+    otherwise it is built and snapshotted.
+    The snapshots are keyed by a hash of all schema files and the versions
+    of the packages contributing schemas to the registries,
+    so they are automatically rebuilt whenever any of them changes.
+    """
+    registry = _registries.get(before_substitution)
+    if registry is not None:
+        return registry
+    variant = "before" if before_substitution else "after"
+    registry = _read_registry_snapshot(variant=variant)
+    if registry is None:
+        registry = (
+            _build_registry_before(_get_registry(before_substitution=False)) if before_substitution
+            else _build_registry_after()
+        )
+        _write_registry_snapshot(variant=variant, registry=registry)
+    _registries[before_substitution] = registry
+    return registry
+
+
+def _build_registry_after() -> _referencing.Registry:
     resources = []
     def_schemas_path = _schema_dir_path
     for schema_filepath in def_schemas_path.glob("**/*.yaml"):
         schema_dict = _ps.read.yaml_from_file(path=schema_filepath)
         _js.edit.required_last(schema_dict)
         _add_custom_keys(schema_dict)
-        resources.append(make_resource(schema_dict))
+        resources.append(_make_resource(schema_dict))
     registry_after, _ = _mdit_schema.make_registry(dynamic=False, crawl=True, add_resources=resources)
-    resources_before = []
     for registry_schema_id in registry_after:
         registry_schema_dict = registry_after[registry_schema_id].contents
         registry_schema_dict.pop("$schema", None)
         _add_custom_keys(registry_schema_dict)
+    return registry_after
+
+
+def _build_registry_before(registry_after: _referencing.Registry) -> _referencing.Registry:
+    resources_before = []
+    for registry_schema_id in registry_after:
+        registry_schema_dict = registry_after[registry_schema_id].contents
         registry_schema_spec = registry_after[registry_schema_id]._specification
         registry_schema_dict_before = modify_schema(copy.deepcopy(registry_schema_dict))
-        resources_before.append(make_resource(registry_schema_dict_before, spec=registry_schema_spec))
+        resources_before.append(_make_resource(registry_schema_dict_before, spec=registry_schema_spec))
+    return resources_before @ _referencing.Registry()
 
-    registry_before = resources_before @ _referencing.Registry()
-    return registry_before, registry_after
 
+def _make_resource(
+    schema: dict, spec: _referencing.Specification = _referencing_jsonschema.DRAFT202012
+) -> _referencing.Resource:
+    return _referencing.Resource.from_contents(schema, default_specification=spec)
 
-def get_registry():
 
-    def make_resource(
-        schema: dict, spec: _referencing.Specification = _referencing_jsonschema.DRAFT202012
-    ) -> _referencing.Resource:
-        return _referencing.Resource.from_contents(schema, default_specification=spec)
+@_functools.cache
+def _registry_snapshot_key() -> str:
+    hasher = _hashlib.sha256()
+    for dist_name in ("ControlMan", "MDit", "JSONSchemata"):
+        try:
+            dist_version = _importlib_metadata.version(dist_name)
+        except _importlib_metadata.PackageNotFoundError:
+            dist_version = ""
+        hasher.update(f"{dist_name}=={dist_version}\n".encode())
+    for schema_filepath in sorted(_schema_dir_path.glob("**/*.yaml")):
+        hasher.update(schema_filepath.relative_to(_schema_dir_path).as_posix().encode())
+        hasher.update(schema_filepath.read_bytes())
+    return hasher.hexdigest()
+
+
+def _compiled_validator_key(schema: str, before_substitution: bool, fill_defaults: bool) -> str:
+    # Compiled code is only valid for the exact Python version that created it.
+    return _hashlib.sha256(
+        f"{_registry_snapshot_key()}|{_sys.version}|{schema}|{before_substitution}|{fill_defaults}".encode()
+    ).hexdigest()
+
+
+def _subtree_hash(data) -> str | None:
+    """Hash of a data subtree, or `None` if it cannot be hashed reliably."""
+
+    def serialize_date(obj):
+        if isinstance(obj, _datetime.date):
+            return obj.isoformat()
+        raise TypeError
+
+    try:
+        serialized = _json.dumps(data, sort_keys=True, separators=(",", ":"), default=serialize_date)
+    except (TypeError, ValueError):
+        return
+    return _hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def _metadata_hash(data: dict) -> str:
+    hasher = _hashlib.sha256(_registry_snapshot_key().encode())
+    try:
+        trove_classifiers_version = _importlib_metadata.version("trove-classifiers")
+    except _importlib_metadata.PackageNotFoundError:
+        trove_classifiers_version = ""
+    hasher.update(trove_classifiers_version.encode())
+    hasher.update(_json.dumps(data, sort_keys=True, separators=(",", ":")).encode())
+    return hasher.hexdigest()
 
+
+def _user_cache_dir() -> _Path:
+    cache_home = _os.environ.get("XDG_CACHE_HOME") or _Path.home() / ".cache"
+    return _Path(cache_home) / "controlman"
+
+
+def _registry_snapshot_path(variant: _Literal["before", "after"]) -> _Path:
+    """Snapshot location in the user cache directory.
+
+    The snapshot is never written to the package directory,
+    which may be read-only or shared between users.
+    """
+    return _user_cache_dir() / _const.FILENAME_SCHEMA_REGISTRY_SNAPSHOT.format(variant=variant)
+
+
+def _read_registry_snapshot(variant: _Literal["before", "after"]) -> _referencing.Registry | None:
+    try:
+        snapshot = _pickle.loads(_registry_snapshot_path(variant).read_bytes())
+    except (OSError, _pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return
+    if not isinstance(snapshot, dict) or snapshot.get("key") != _registry_snapshot_key():
+        return
+    try:
+        registry = _referencing.Registry().with_resources(
+            (schema_id, _referencing.Resource(contents=contents, specification=_specifications[spec_name]))
+            for schema_id, spec_name, contents in snapshot["resources"]
+        )
+    except (KeyError, TypeError, ValueError):
+        return
+    return registry.crawl() if variant == "after" else registry
+
+
+def _write_registry_snapshot(variant: _Literal["before", "after"], registry: _referencing.Registry) -> None:
+    snapshot = {
+        "key": _registry_snapshot_key(),
+        "resources": [
+            [schema_id, registry[schema_id]._specification.name, registry[schema_id].contents]
+            for schema_id in registry
+        ],
+    }
+    try:
+        snapshot_bytes = _pickle.dumps(snapshot, protocol=_pickle.HIGHEST_PROTOCOL)
+    except (_pickle.PicklingError, TypeError):
+        return
+    _write_atomic(path=_registry_snapshot_path(variant), content=snapshot_bytes)
+    return
+
+
+def _write_atomic(path: _Path, content: bytes) -> None:
+    """Write content to a file, if it is writable.
+
+    The content is written to a temporary file first,
+    so that concurrent processes never read a partial file.
+    """
+    temp_path = path.with_name(f"{path.name}.{_os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path.write_bytes(content)
+        _os.replace(temp_path, path)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+    return
+
+
+def get_registry():
     resources = []
     for schema_filepath in _schema_dir_path.glob("**/*.yaml"):
         schema_dict = _ps.read.yaml_from_file(path=schema_filepath)
-        resources.append(make_resource(schema_dict))
+        resources.append(_make_resource(schema_dict))
     registry, _ = _mdit_schema.make_registry(dynamic=False, crawl=True, add_resources=resources)
     return registry
 
@@ -580,4 +1277,8 @@ def _add_custom_keys(schema: dict):
     return
 
 
-_registry_before, _registry_after = _make_registry()
+_registries: dict[bool, _referencing.Registry] = {}
+_schemas: dict[tuple[str, bool], dict] = {}
+_validators: dict[tuple[str, bool, bool], _jsonschema.protocols.Validator] = {}
+_compiled_validators: dict[tuple[str, bool, bool], _CompiledSchema] = {}
+_user_schema_validators: dict[str, tuple[dict, _CompiledSchema]] = {}
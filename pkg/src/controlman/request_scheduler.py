@@ -0,0 +1,243 @@
+"""Scheduling of outbound web API requests.
+
+All requests to external services (GitHub, ORCID, DOI resolvers, SPDX, and `!ext` URLs)
+are sent through a `RequestScheduler`, which
+limits the number of concurrent requests per host,
+pauses all requests to a host when its rate limit is exhausted,
+and retries rate-limited and temporarily failed requests with exponential backoff.
+"""
+
+from __future__ import annotations as _annotations
+
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+from urllib.parse import urlsplit as _urlsplit
+import random as _random
+import threading as _threading
+import time as _time
+
+from loggerman import logger as _logger
+from pylinks.exception.api import (
+    WebAPIRequestError as _WebAPIRequestError,
+    WebAPITemporaryStatusCodeError as _WebAPITemporaryStatusCodeError,
+    WebAPIPersistentStatusCodeError as _WebAPIPersistentStatusCodeError,
+)
+import requests as _requests
+import requests.adapters as _requests_adapters
+
+if _TYPE_CHECKING:
+    from typing import Any, Callable
+
+
+HOST_GITHUB_API = "api.github.com"
+HOST_GITHUB_RAW = "raw.githubusercontent.com"
+HOST_ORCID_API = "pub.orcid.org"
+HOST_DOI = "doi.org"
+
+
+class RequestScheduler:
+    """Rate-limit-aware scheduler for web API requests.
+
+    Parameters
+    ----------
+    max_concurrency
+        Default maximum number of concurrent requests per host.
+    max_concurrency_per_host
+        Maximum number of concurrent requests for specific hosts,
+        overriding `max_concurrency`.
+    num_tries
+        Maximum number of attempts for each request.
+    backoff_init
+        Waiting time in seconds before the first retry.
+        The waiting time is doubled for each subsequent retry.
+    max_wait
+        Maximum time in seconds to wait for a rate limit to reset.
+        Requests that would need to wait longer fail immediately.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        max_concurrency_per_host: dict[str, int] | None = None,
+        num_tries: int = 5,
+        backoff_init: float = 1,
+        max_wait: float = 900,
+    ):
+        self._max_concurrency = max_concurrency
+        # GitHub recommends avoiding concurrent requests to prevent secondary rate limits.
+        self._max_concurrency_per_host = {HOST_GITHUB_API: 4} | (max_concurrency_per_host or {})
+        self._num_tries = num_tries
+        self._backoff_init = backoff_init
+        self._max_wait = max_wait
+        self._lock = _threading.Lock()
+        self._semaphores: dict[str, _threading.BoundedSemaphore] = {}
+        self._blocked_until: dict[str, float] = {}
+        self._pending_logs: list[str] = []
+        self._session = _requests.Session()
+        # One connection pool per host, large enough for all concurrent requests.
+        adapter = _requests_adapters.HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=max(max_concurrency, *self._max_concurrency_per_host.values()),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        return
+
+    def request(
+        self,
+        url: str,
+        verb: str = "GET",
+        headers: dict | None = None,
+        data: Any = None,
+        json: Any = None,
+        timeout: float | tuple[float, float] = (10, 20),
+    ) -> _requests.Response:
+        """Send an HTTP request over a pooled connection.
+
+        Raises
+        ------
+        pylinks.exception.api.WebAPIRequestError
+            If the request could not be sent.
+        pylinks.exception.api.WebAPIStatusCodeError
+            If the response has an error status code after all retries.
+        """
+        host = _urlsplit(url).hostname or ""
+        for attempt in range(self._num_tries):
+            with self._semaphore(host):
+                self._wait_for(host)
+                try:
+                    response = self._session.request(
+                        verb, url, headers=headers, data=data, json=json, timeout=timeout
+                    )
+                except _requests.RequestException as e:
+                    if attempt == self._num_tries - 1:
+                        raise _WebAPIRequestError(e) from e
+                    delay = self._backoff(attempt)
+                else:
+                    self._update_rate_limit(host, response)
+                    if response.status_code < 400:
+                        return response
+                    delay = self._retry_delay(host, response, attempt)
+                    if delay is None or attempt == self._num_tries - 1:
+                        if response.status_code in (408, 429, 500, 502, 503, 504):
+                            raise _WebAPITemporaryStatusCodeError(response)
+                        raise _WebAPIPersistentStatusCodeError(response)
+            self._log(
+                f"Request to '{host}' failed (attempt {attempt + 1}/{self._num_tries}); "
+                f"retrying in {delay:.1f} seconds."
+            )
+            _time.sleep(delay)
+        # Only reached when no attempts are allowed.
+        raise _WebAPIRequestError(
+            _requests.RequestException(f"Request to '{url}' was not sent; number of tries is {self._num_tries}.")
+        )
+
+    def call(self, host: str, func: Callable, *args, **kwargs):
+        """Call a function that sends its own request to a host, e.g., a third-party client.
+
+        The call counts towards the host's concurrency limit,
+        and waits while the host's rate limit is exhausted.
+        Since such functions usually retry failed requests themselves,
+        they are not retried again.
+        """
+        with self._semaphore(host):
+            self._wait_for(host)
+            return func(*args, **kwargs)
+
+    def flush_log(self) -> None:
+        """Log the messages of requests sent from worker threads.
+
+        The logger is not thread-safe, so messages from threads other than the main thread
+        are collected, and logged when the main thread calls this method,
+        e.g., after all workers have finished.
+        """
+        with self._lock:
+            messages, self._pending_logs = self._pending_logs, []
+        for message in messages:
+            _logger.info("Request Scheduler", message)
+        return
+
+    def _log(self, message: str) -> None:
+        if _threading.current_thread() is not _threading.main_thread():
+            with self._lock:
+                self._pending_logs.append(message)
+            return
+        self.flush_log()
+        _logger.info("Request Scheduler", message)
+        return
+
+    def _semaphore(self, host: str) -> _threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = _threading.BoundedSemaphore(
+                    self._max_concurrency_per_host.get(host, self._max_concurrency)
+                )
+            return self._semaphores[host]
+
+    def _wait_for(self, host: str) -> None:
+        with self._lock:
+            blocked_until = self._blocked_until.get(host, 0)
+        delay = blocked_until - _time.time()
+        if delay > 0:
+            self._log(f"Rate limit of '{host}' exhausted; waiting {delay:.1f} seconds.")
+            _time.sleep(delay)
+        return
+
+    def _block(self, host: str, delay: float) -> None:
+        with self._lock:
+            self._blocked_until[host] = max(self._blocked_until.get(host, 0), _time.time() + delay)
+        return
+
+    def _update_rate_limit(self, host: str, response: _requests.Response) -> None:
+        """Pause requests to the host when the response reports an exhausted rate limit."""
+        if response.headers.get("X-RateLimit-Remaining") != "0":
+            return
+        reset = response.headers.get("X-RateLimit-Reset")
+        if reset and reset.isdigit():
+            delay = int(reset) - _time.time() + 1
+            if 0 < delay <= self._max_wait:
+                self._block(host, delay)
+        return
+
+    def _retry_delay(self, host: str, response: _requests.Response | None, attempt: int) -> float | None:
+        """Time to wait before retrying a failed response, or `None` if it should not be retried.
+
+        References
+        ----------
+        - [GitHub Docs: Rate limits for the REST API](https://docs.github.com/en/rest/using-the-rest-api/rate-limits-for-the-rest-api#exceeding-the-rate-limit)
+        """
+        if response is None:
+            return
+        headers = response.headers
+        rate_limited = response.status_code == 429 or (
+            response.status_code == 403
+            and (
+                headers.get("X-RateLimit-Remaining") == "0"
+                or "Retry-After" in headers
+                or "rate limit" in response.text.lower()
+            )
+        )
+        if rate_limited:
+            retry_after = headers.get("Retry-After")
+            reset = headers.get("X-RateLimit-Reset")
+            if retry_after and retry_after.isdigit():
+                delay = float(retry_after)
+            elif headers.get("X-RateLimit-Remaining") == "0" and reset and reset.isdigit():
+                # The reset time may already have passed, e.g., due to clock skew or a slow response.
+                delay = max(int(reset) - _time.time() + 1, self._backoff(attempt))
+            else:
+                # Secondary rate limits without further information; wait at least one minute.
+                delay = max(60, self._backoff(attempt))
+            if delay > self._max_wait:
+                return
+            self._block(host, delay)
+            return delay
+        if response.status_code in (408, 500, 502, 503, 504):
+            return self._backoff(attempt)
+        return
+
+    def _backoff(self, attempt: int) -> float:
+        return self._backoff_init * 2 ** attempt * _random.uniform(1, 1.5)
+
+
+scheduler = RequestScheduler()
+"""Default request scheduler, shared by all components of ControlMan."""
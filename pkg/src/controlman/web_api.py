@@ -0,0 +1,203 @@
+"""Web API clients sending all their requests through the request scheduler.
+
+These extend the corresponding `pylinks` API clients,
+replacing their direct (non-pooled and independently retried) requests
+with requests sent by a `controlman.request_scheduler.RequestScheduler`,
+so that all requests share one connection pool, one retry policy,
+and the rate limit information of every response.
+"""
+
+from __future__ import annotations as _annotations
+
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+from pylinks.api.github import GitHub as _GitHub, User as _User, Repo as _Repo
+from pylinks.api.orcid import Orcid as _Orcid
+from pylinks.api.doi import DOI as _DOI
+from pylinks.exception.api import GraphQLResponseError as _GraphQLResponseError
+
+from controlman import request_scheduler as _request_scheduler
+
+if _TYPE_CHECKING:
+    from typing import Any, Literal
+    from controlman.request_scheduler import RequestScheduler
+
+
+class GitHub(_GitHub):
+    """GitHub API client.
+
+    Parameters
+    ----------
+    token
+        GitHub token for authenticated requests.
+    timezone
+        Timezone for timestamps in responses.
+    scheduler
+        Request scheduler to send requests with.
+        Defaults to `controlman.request_scheduler.scheduler`.
+    """
+
+    def __init__(
+        self,
+        token: str | None = None,
+        timezone: str | None = "UTC",
+        scheduler: RequestScheduler | None = None,
+    ):
+        super().__init__(token=token, timezone=timezone)
+        self._timezone = timezone
+        self._scheduler = scheduler or _request_scheduler.scheduler
+        return
+
+    def user(self, username) -> GitHubUser:
+        return GitHubUser(username=username, github=self)
+
+    def user_from_id(self, user_id) -> GitHubUser:
+        user_data = self.rest_query(f"user/{user_id}")
+        return GitHubUser(username=user_data["login"], github=self)
+
+    def graphql_query(
+        self,
+        query: str,
+        variables: dict[str, tuple[Any, str, bool]] | None = None,
+        extra_headers: dict | None = None,
+    ) -> dict:
+        if variables:
+            args = ", ".join(
+                f"${name}:{typ}{"!" if required else ""}" for name, (_, typ, required) in variables.items()
+            )
+            sig = f"query({args})"
+        else:
+            sig = "query"
+        return self._graphql(
+            query=f"{sig} {{{query}}}",
+            variables={name: value for name, (value, _, _) in variables.items()} if variables else None,
+            extra_headers=extra_headers,
+        )
+
+    def graphql_mutation(
+        self,
+        mutation_name: str,
+        mutation_input_name: str,
+        mutation_input: dict,
+        mutation_payload: str,
+        extra_headers: dict | None = None,
+    ):
+        query = (
+            f'mutation($mutationInput:{mutation_input_name}!) '
+            f'{{{mutation_name}(input:$mutationInput) {{{mutation_payload}}}}}'
+        )
+        return self._graphql(query=query, variables={"mutationInput": mutation_input}, extra_headers=extra_headers)
+
+    def rest_query(
+        self,
+        query: str,
+        verb: Literal["GET", "POST", "PUT", "PATCH", "OPTIONS", "DELETE"] = "GET",
+        data=None,
+        json=None,
+        response_type: Literal["json", "str", "bytes"] | None = "json",
+        extra_headers: dict | None = None,
+        endpoint: Literal["api", "upload"] = "api",
+    ):
+        headers = self._headers | extra_headers if extra_headers else self._headers
+        response = self._scheduler.request(
+            url=str(self._endpoint[endpoint] / query),
+            verb=verb,
+            headers=headers,
+            data=data,
+            json=json,
+        )
+        if response_type == "json":
+            return response.json()
+        if response_type == "str":
+            return response.text
+        if response_type == "bytes":
+            return response.content
+        return response
+
+    def _graphql(self, query: str, variables: dict | None, extra_headers: dict | None) -> dict:
+        payload = {"query": query}
+        if variables is not None:
+            payload["variables"] = variables
+        response = self.rest_query("graphql", verb="POST", json=payload, extra_headers=extra_headers)
+        if "errors" in response or "data" not in response:
+            raise _GraphQLResponseError(response, query)
+        return response["data"]
+
+
+class GitHubUser(_User):
+    """GitHub user, sending requests with the client that created it."""
+
+    def __init__(self, username: str, github: GitHub):
+        super().__init__(username=username, token=github._token, timezone=github._timezone)
+        self._github = github
+        return
+
+    def repo(self, repo_name) -> GitHubRepo:
+        return GitHubRepo(username=self.username, name=repo_name, github=self._github)
+
+
+class GitHubRepo(_Repo):
+    """GitHub repository, sending requests with the client that created it."""
+
+    def __init__(self, username: str, name: str, github: GitHub):
+        super().__init__(username=username, name=name, token=github._token, timezone=github._timezone)
+        self._github = github
+        return
+
+
+class Orcid(_Orcid):
+    """ORCID API client for a single ORCID ID, sending requests with a request scheduler."""
+
+    def __init__(self, orcid_id: str, scheduler: RequestScheduler | None = None):
+        super().__init__(orcid_id=orcid_id)
+        self._scheduler = scheduler or _request_scheduler.scheduler
+        return
+
+    @property
+    def records(self) -> dict:
+        if not self._data:
+            self._data = self._scheduler.request(
+                url=f"https://{_request_scheduler.HOST_ORCID_API}/v3.0/{self.id}",
+                headers={"Accept": "application/json"},
+            ).json()
+        return self._data
+
+
+class DOI(_DOI):
+    """DOI resolver client for a single DOI, sending requests with a request scheduler.
+
+    Notes
+    -----
+    Journal abbreviations that are missing from the citation data
+    are still retrieved by `pylinks` directly.
+    """
+
+    def __init__(self, doi: str, scheduler: RequestScheduler | None = None):
+        super().__init__(doi=doi)
+        self._scheduler = scheduler or _request_scheduler.scheduler
+        return
+
+    def text(self, style: str | None = None, locale: str | None = None) -> str:
+        accept = "text/x-bibliography"
+        if style:
+            accept += f"; style={style}"
+        if locale:
+            accept += f"; locale={locale}"
+        return self._get(accept).text
+
+    @property
+    def bibtex(self) -> str:
+        return self._get("application/x-bibtex").text
+
+    @property
+    def ris(self) -> str:
+        return self._get("application/x-research-info-systems").text
+
+    @property
+    def citeproc_dict(self) -> dict:
+        return self._get("application/citeproc+json").json()
+
+    def _get(self, accept: str):
+        response = self._scheduler.request(url=self.url, headers={"accept": accept})
+        response.encoding = "utf-8"
+        return response
@@ -0,0 +1,11 @@
+import contextlib
+
+import pytest
+from loggerman import logger
+
+
+@pytest.fixture(autouse=True)
+def no_log_sections(monkeypatch):
+    """Disable log sections, which require an initialized logger."""
+    monkeypatch.setattr(logger, "sectioning", lambda *args, **kwargs: contextlib.nullcontext())
+    return
@@ -0,0 +1,60 @@
+import json
+import sqlite3
+
+import pytest
+
+from controlman import const
+from controlman.cache_manager import CacheManager
+
+
+def make_manager(path, backend: str = "yaml") -> CacheManager:
+    return CacheManager(path_local_cache=path, retention_hours={"user": 24}, max_items={"user": 3}, backend=backend)
+
+
+@pytest.mark.parametrize("backend", ["yaml", "sqlite"])
+def test_eviction_after_read_only_run(tmp_path, backend):
+    manager = make_manager(tmp_path, backend=backend)
+    for key in ("a", "b", "c"):
+        manager.set("user", key, {"name": key})
+    manager.save()
+    # A run that only reads an item must still record its access time.
+    manager = make_manager(tmp_path, backend=backend)
+    assert manager.get("user", "a") == {"name": "a"}
+    manager.save()
+    manager = make_manager(tmp_path, backend=backend)
+    manager.set("user", "d", {"name": "d"})
+    manager.save()
+    manager = make_manager(tmp_path, backend=backend)
+    assert [key for key in "abcd" if manager.get("user", key)] == ["a", "c", "d"]
+
+
+def test_sqlite_sequential_managers(tmp_path):
+    writer = make_manager(tmp_path, backend="sqlite")
+    writer.set("user", "a", {"name": "a"})
+    writer.save()
+    reader = make_manager(tmp_path, backend="sqlite")
+    assert reader.get("user", "a") == {"name": "a"}
+    reader.save()
+    # The database must not be locked by the previous managers, which are still referenced.
+    next_writer = make_manager(tmp_path, backend="sqlite")
+    next_writer.set("user", "b", {"name": "b"})
+    next_writer.save()
+    assert make_manager(tmp_path, backend="sqlite").get("user", "b") == {"name": "b"}
+
+
+def test_shared_cache_stores_json(tmp_path):
+    manager = CacheManager(retention_hours={"user": 24}, path_shared_cache=tmp_path)
+    manager.set("user", "a", {"name": "a", "ids": [1, 2]})
+    manager.save()
+    with sqlite3.connect(tmp_path / const.FILENAME_SHARED_METADATA_CACHE) as connection:
+        (data,) = connection.execute("SELECT data FROM cache WHERE typ = 'user' AND key = 'a'").fetchone()
+    assert json.loads(data) == {"name": "a", "ids": [1, 2]}
+    manager = CacheManager(retention_hours={"user": 24}, path_shared_cache=tmp_path)
+    assert manager.get("user", "a") == {"name": "a", "ids": [1, 2]}
+
+
+def test_save_shared_cache_only(tmp_path):
+    manager = CacheManager(retention_hours={"user": 24}, path_shared_cache=tmp_path)
+    manager.set("user", "a", {"name": "a"})
+    manager.save()
+    assert not manager._dirty
@@ -0,0 +1,108 @@
+import copy
+
+import pytest
+
+from controlman import data_helper
+
+
+REST_USER = {
+    "login": "octocat",
+    "id": 583231,
+    "node_id": "MDQ6VXNlcjU4MzIzMQ==",
+    "avatar_url": "https://avatars.githubusercontent.com/u/583231?v=4",
+    "gravatar_id": "",
+    "url": "https://api.github.com/users/octocat",
+    "html_url": "https://github.com/octocat",
+    "followers_url": "https://api.github.com/users/octocat/followers",
+    "repos_url": "https://api.github.com/users/octocat/repos",
+    "type": "User",
+    "site_admin": False,
+    "name": "The Octocat",
+    "company": "@github",
+    "blog": "https://github.blog",
+    "location": "San Francisco",
+    "email": None,
+    "hireable": None,
+    "bio": None,
+    "twitter_username": None,
+    "public_repos": 8,
+    "followers": 16000,
+    "created_at": "2011-01-25T18:44:36Z",
+    "updated_at": "2024-01-22T12:00:00Z",
+}
+"""Recorded REST API response for the user."""
+
+REST_SOCIAL_ACCOUNTS = [{"provider": "linkedin", "url": "https://www.linkedin.com/in/octocat"}]
+"""Recorded REST API response for the user's social accounts."""
+
+GRAPHQL_USER = {
+    "__typename": "User",
+    "login": "octocat",
+    "databaseId": 583231,
+    "id": "MDQ6VXNlcjU4MzIzMQ==",
+    "url": "https://github.com/octocat",
+    "name": "The Octocat",
+    "company": "@github",
+    "bio": "",
+    "avatarUrl": "https://avatars.githubusercontent.com/u/583231?v=4",
+    "websiteUrl": "https://github.blog",
+    "location": "San Francisco",
+    "email": "",
+    "twitterUsername": None,
+    "createdAt": "2011-01-25T18:44:36Z",
+    "socialAccounts": {"nodes": [{"provider": "LINKEDIN", "url": "https://www.linkedin.com/in/octocat"}]},
+}
+"""Recorded GraphQL API response for the user."""
+
+
+class RecordedGitHubUser:
+
+    def __init__(self, requests: list[str]):
+        self._requests = requests
+        return
+
+    @property
+    def info(self) -> dict:
+        self._requests.append("info")
+        return copy.deepcopy(REST_USER)
+
+    @property
+    def social_accounts(self) -> list[dict]:
+        self._requests.append("social_accounts")
+        return copy.deepcopy(REST_SOCIAL_ACCOUNTS)
+
+
+class RecordedGitHub:
+    """Stand-in for the GitHub API client, returning recorded responses."""
+
+    def __init__(self, authenticated: bool):
+        self.authenticated = authenticated
+        self.requests = []
+        return
+
+    def user(self, username: str) -> RecordedGitHubUser:
+        assert username == REST_USER["login"]
+        return RecordedGitHubUser(self.requests)
+
+    def user_from_id(self, user_id: int) -> RecordedGitHubUser:
+        assert user_id == REST_USER["id"]
+        self.requests.append("user_from_id")
+        return RecordedGitHubUser(self.requests)
+
+    def rest_query(self, query: str, verb: str, json: dict) -> dict:
+        self.requests.append("graphql")
+        return {"data": {"user0": copy.deepcopy(GRAPHQL_USER)}}
+
+
+@pytest.mark.parametrize("user", [("octocat", None), ("octocat", 583231)])
+def test_github_user_format(user):
+    rest_api = RecordedGitHub(authenticated=False)
+    graphql_api = RecordedGitHub(authenticated=True)
+    from_rest = data_helper._get_github_users(github_api=rest_api, users=[user])
+    from_graphql = data_helper._get_github_users(github_api=graphql_api, users=[user])
+    assert from_graphql == from_rest
+    if user[1]:
+        # Users with a REST ID are looked up by ID.
+        assert graphql_api.requests == ["user_from_id", "info", "social_accounts"]
+    else:
+        assert graphql_api.requests == ["graphql", "info"]
@@ -0,0 +1,52 @@
+import copy
+
+import pytest
+
+from controlman import data_validator
+
+
+@pytest.fixture
+def data() -> dict:
+    """Valid data before substitution, with a placeholder for each top-level key that has a default."""
+    schema = data_validator._get_prepared_schema(schema="main", before_substitution=True)
+    data = {key: f"${{{{ {key} }}}}" for key, subschema in schema["properties"].items() if "default" in subschema}
+    data["workflow"] = {"web": "${{ workflow.web }}"}
+    return data
+
+
+def test_subtree_validator_revalidates_changed_key(data):
+    validator = data_validator.SubtreeValidator(source="source", before_substitution=True)
+    validator.validate(data)
+    expected = copy.deepcopy(data) | {"name": "${{ name.changed }}"}
+    data["name"] = "${{ name.changed }}"
+    validator.validate(data)
+    assert data == expected
+
+
+@pytest.fixture
+def sparse_data() -> dict:
+    """Valid data before substitution, with missing top-level keys and missing defaults in a section."""
+    return {"name": "${{ name }}", "control": {"path": ".control"}, "workflow": {"web": "${{ workflow.web }}"}}
+
+
+def test_validate_processes(sparse_data):
+    sequential = copy.deepcopy(sparse_data)
+    concurrent = copy.deepcopy(sparse_data)
+    data_validator.validate(sequential, source="source", before_substitution=True, processes=1)
+    data_validator.validate(concurrent, source="source", before_substitution=True, processes=2)
+    assert concurrent == sequential
+    assert "cache" in concurrent["control"]
+
+
+def test_subtree_validator_processes(sparse_data):
+    results = []
+    for processes in (1, 2):
+        data = copy.deepcopy(sparse_data)
+        validator = data_validator.SubtreeValidator(source="source", before_substitution=True, processes=processes)
+        validator.validate(data)
+        data["name"] = "${{ name.changed }}"
+        data["control"] = {"path": ".control-changed"}
+        validator.validate(data)
+        results.append(data)
+    assert results[1] == results[0]
+    assert "cache" in results[1]["control"]
@@ -0,0 +1,23 @@
+import time
+
+import requests
+
+from controlman.request_scheduler import RequestScheduler
+
+
+def make_response(status_code: int, headers: dict | None = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = b"{}"
+    return response
+
+
+def test_retry_after_passed_rate_limit_reset(monkeypatch):
+    scheduler = RequestScheduler(num_tries=2, backoff_init=0.01)
+    responses = [
+        make_response(403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(time.time()) - 100)}),
+        make_response(200),
+    ]
+    monkeypatch.setattr(scheduler._session, "request", lambda *args, **kwargs: responses.pop(0))
+    assert scheduler.request("https://api.github.com/rate_limit").status_code == 200